@@ -1,4 +1,10 @@
+from datetime import timedelta
+
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections
+from django.utils import timezone
+from .filters import ISSUE_SEARCH_CONFIG
 from .models import (
     Course,
     Project,
@@ -12,6 +18,34 @@ from .models import (
 )
 
 
+class CreatedAtFilter(admin.SimpleListFilter):
+    """
+    Filter by creation date using indexable range lookups, without the
+    per-page date aggregation query that date_hierarchy runs.
+    """
+
+    title = "created"
+    parameter_name = "created"
+
+    def lookups(self, request, model_admin):
+        return (
+            ("today", "Today"),
+            ("week", "Past 7 days"),
+            ("month", "This month"),
+        )
+
+    def queryset(self, request, queryset):
+        now = timezone.localtime()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if self.value() == "today":
+            return queryset.filter(created_at__gte=today)
+        if self.value() == "week":
+            return queryset.filter(created_at__gte=today - timedelta(days=7))
+        if self.value() == "month":
+            return queryset.filter(created_at__gte=today.replace(day=1))
+        return queryset
+
+
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
     list_display = ("name", "duration_in_weeks", "created_at")
@@ -23,6 +57,7 @@ class ProjectAdmin(admin.ModelAdmin):
     list_display = ("name", "course", "week_number", "total_tasks")
     list_filter = ("course", "week_number")
     search_fields = ("name",)
+    list_select_related = ("course",)
 
 
 @admin.register(Task)
@@ -30,6 +65,7 @@ class TaskAdmin(admin.ModelAdmin):
     list_display = ("title", "project", "task_number")
     list_filter = ("project",)
     search_fields = ("title",)
+    list_select_related = ("project",)
 
 
 @admin.register(Issue)
@@ -44,9 +80,22 @@ class IssueAdmin(admin.ModelAdmin):
         "assigned_to",
         "created_at",
     )
-    list_filter = ("status", "category", "urgency", "cohort")
+    list_filter = (CreatedAtFilter, "status", "category", "urgency", "cohort")
     search_fields = ("title", "description")
-    date_hierarchy = "created_at"
+    list_select_related = (
+        "reported_by",
+        "assigned_to",
+        "course",
+        "project",
+        "task__project",
+    )
+
+    def get_search_results(self, request, queryset, search_term):
+        # Use the GIN-indexed search vector instead of ILIKE on PostgreSQL
+        if search_term and connections[queryset.db].vendor == "postgresql":
+            query = SearchQuery(search_term, config=ISSUE_SEARCH_CONFIG)
+            return queryset.filter(search_vector=query), False
+        return super().get_search_results(request, queryset, search_term)
 
 
 @admin.register(Comment)
@@ -54,12 +103,14 @@ class CommentAdmin(admin.ModelAdmin):
     list_display = ("issue", "user", "created_at")
     list_filter = ("created_at",)
     search_fields = ("content",)
+    list_select_related = ("issue", "user")
 
 
 @admin.register(IssueFeedback)
 class IssueFeedbackAdmin(admin.ModelAdmin):
     list_display = ("issue", "rating", "created_at")
     list_filter = ("rating",)
+    list_select_related = ("issue",)
 
 
 @admin.register(IssueHistory)
@@ -67,6 +118,7 @@ class IssueHistoryAdmin(admin.ModelAdmin):
     list_display = ("issue", "action", "performed_by", "timestamp")
     list_filter = ("timestamp",)
     search_fields = ("action",)
+    list_select_related = ("issue", "performed_by")
 
 
 @admin.register(Attachment)
@@ -74,6 +126,7 @@ class AttachmentAdmin(admin.ModelAdmin):
     list_display = ("issue", "file_name", "uploaded_by", "uploaded_at")
     list_filter = ("uploaded_at",)
     search_fields = ("file_name",)
+    list_select_related = ("issue", "uploaded_by")
 
 
 @admin.register(IssueTemplate)
@@ -81,3 +134,4 @@ class IssueTemplateAdmin(admin.ModelAdmin):
     list_display = ("title", "category", "created_by", "created_at")
     list_filter = ("category", "created_at")
     search_fields = ("title", "description_template")
+    list_select_related = ("created_by",)
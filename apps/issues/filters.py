@@ -0,0 +1,93 @@
+import django_filters
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from rest_framework import filters
+
+from .models import Project, Task, Issue
+
+# Text search configuration the issue search_vector trigger indexes with
+ISSUE_SEARCH_CONFIG = "english"
+
+
+class ProjectFilterSet(django_filters.FilterSet):
+    """
+    Filters for the project list.
+    """
+
+    course = django_filters.NumberFilter(field_name="course")
+    week_number = django_filters.NumberFilter()
+
+    class Meta:
+        model = Project
+        fields = []
+
+
+class TaskFilterSet(django_filters.FilterSet):
+    """
+    Filters for the task list.
+    """
+
+    project = django_filters.NumberFilter(field_name="project")
+    task_number = django_filters.NumberFilter()
+
+    class Meta:
+        model = Task
+        fields = []
+
+
+class IssueFilterSet(django_filters.FilterSet):
+    """
+    Filters for the issue list endpoints.
+    """
+
+    status = django_filters.ChoiceFilter(choices=Issue.STATUS_CHOICES)
+    category = django_filters.ChoiceFilter(choices=Issue.CATEGORY_CHOICES)
+    urgency = django_filters.ChoiceFilter(choices=Issue.URGENCY_CHOICES)
+    course = django_filters.NumberFilter(field_name="course")
+    project = django_filters.NumberFilter(field_name="project")
+    task = django_filters.NumberFilter(field_name="task")
+    cohort = django_filters.CharFilter()
+    week_number = django_filters.NumberFilter()
+    reported_by = django_filters.NumberFilter(field_name="reported_by")
+    assigned_to = django_filters.NumberFilter(field_name="assigned_to")
+
+    class Meta:
+        model = Issue
+        fields = []
+
+
+class IssueSearchFilter(filters.SearchFilter):
+    """
+    Full-text search over the GIN-indexed issue search_vector on PostgreSQL,
+    annotating each match with its search_rank. Other databases fall back to
+    SearchFilter's icontains lookups over search_fields.
+    """
+
+    search_config = ISSUE_SEARCH_CONFIG
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        query = SearchQuery(" ".join(terms), config=self.search_config)
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F("search_vector"), query)
+        )
+
+
+class IssueOrderingFilter(filters.OrderingFilter):
+    """
+    OrderingFilter that puts the best full-text matches first when the
+    client searches without choosing an ordering.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if (
+            "search_rank" in queryset.query.annotations
+            and not request.query_params.get(self.ordering_param)
+        ):
+            default_ordering = self.get_default_ordering(view) or ()
+            return queryset.order_by("-search_rank", *default_ordering)
+        return super().filter_queryset(request, queryset, view)
@@ -32,17 +32,23 @@ class Command(BaseCommand):
             )
         )
 
-        # Create test tasks
-        for i in range(1, 6):
-            task, created = Task.objects.get_or_create(
-                project=project,
-                task_number=i,
-                defaults={"title": f"Task {i}: Implement signal {i}"},
+        # Create test tasks missing from the project in a single insert
+        existing = set(
+            Task.objects.filter(project=project).values_list("task_number", flat=True)
+        )
+        tasks = [
+            Task(
+                project=project, task_number=i, title=f"Task {i}: Implement signal {i}"
             )
+            for i in range(1, 6)
+            if i not in existing
+        ]
+        Task.objects.bulk_create(tasks, ignore_conflicts=True)
+        for task in tasks:
+            self.stdout.write(self.style.SUCCESS(f"Task created: {task.title}"))
+        if existing:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f"Task {'created' if created else 'already exists'}: {task.title}"
-                )
+                self.style.SUCCESS(f"Tasks already exist: {len(existing)}")
             )
 
         self.stdout.write(self.style.SUCCESS("Test data created successfully!"))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0002_attachment_content_type_attachment_file_size_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issues_issu_status_003ba6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issues_issu_categor_12b737_idx',
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['cohort', 'status', '-created_at'], name='issue_cohort_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['assigned_to', 'status'], name='issue_assigned_status'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['-created_at'], name='issue_open_created'),
+        ),
+    ]
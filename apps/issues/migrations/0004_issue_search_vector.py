@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:31
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_TRIGGER_SQL = """
+CREATE INDEX issue_fts_gin ON issues_issue USING gin (search_vector);
+CREATE TRIGGER issue_search_vector_update
+    BEFORE INSERT OR UPDATE ON issues_issue
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, description);
+UPDATE issues_issue SET search_vector =
+    to_tsvector('pg_catalog.english', coalesce(title, '') || ' ' || coalesce(description, ''));
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS issue_search_vector_update ON issues_issue;
+DROP INDEX IF EXISTS issue_fts_gin;
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    # GIN indexes and tsvector triggers only exist on PostgreSQL
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(SEARCH_TRIGGER_SQL)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_SEARCH_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0003_issue_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0004_issue_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='issuehistory',
+            name='performed_by',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='issue_actions', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0005_issuehistory_performed_by_no_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issues_issu_cohort_1b5a65_idx',
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['cohort', '-created_at'], name='issue_cohort_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['reported_by', '-created_at'], name='issue_reporter_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['assigned_to', '-created_at'], name='issue_assignee_created_idx'),
+        ),
+    ]
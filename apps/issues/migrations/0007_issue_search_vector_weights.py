@@ -0,0 +1,53 @@
+from django.db import migrations
+
+
+WEIGHTED_TRIGGER_SQL = """
+CREATE FUNCTION issue_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS issue_search_vector_update ON issues_issue;
+CREATE TRIGGER issue_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, description ON issues_issue
+    FOR EACH ROW EXECUTE FUNCTION issue_search_vector_refresh();
+UPDATE issues_issue SET search_vector =
+    setweight(to_tsvector('pg_catalog.english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.english', coalesce(description, '')), 'B');
+"""
+
+UNWEIGHTED_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS issue_search_vector_update ON issues_issue;
+DROP FUNCTION IF EXISTS issue_search_vector_refresh();
+CREATE TRIGGER issue_search_vector_update
+    BEFORE INSERT OR UPDATE ON issues_issue
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, description);
+UPDATE issues_issue SET search_vector =
+    to_tsvector('pg_catalog.english', coalesce(title, '') || ' ' || coalesce(description, ''));
+"""
+
+
+def weight_search_vector(apps, schema_editor):
+    # Rank title matches above description matches (PostgreSQL only)
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(WEIGHTED_TRIGGER_SQL)
+
+
+def unweight_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(UNWEIGHTED_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0006_issue_personal_created_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(weight_search_vector, unweight_search_vector),
+    ]
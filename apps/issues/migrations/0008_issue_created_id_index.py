@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-14 14:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0007_issue_search_vector_weights'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='issue',
+            name='issues_issu_created_6f38eb_idx',
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['-created_at', '-id'], name='issue_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-14 15:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0008_issue_created_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attachment',
+            index=models.Index(fields=['-uploaded_at'], name='attachment_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attachment',
+            index=models.Index(fields=['issue', '-uploaded_at'], name='attachment_issue_uploaded'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from .utils import (
+    detect_mime_type,
     validate_file_size,
     validate_file_type,
     sanitize_filename,
@@ -137,35 +139,96 @@ class Issue(models.Model):
     cohort = models.CharField(max_length=50)
     week_number = models.PositiveIntegerField()
 
+    # Columns whose stored values save() and the notification signals track
+    STATE_FIELDS = frozenset({"status", "assigned_to", "assigned_to_id"})
+
+    # Full-text search document over title and description. On PostgreSQL it
+    # is kept up to date by a trigger and GIN-indexed (see migration 0004).
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return f"Issue #{self.id}: {self.title} ({self.status})"
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["status"]),
-            models.Index(fields=["category"]),
-            models.Index(fields=["cohort"]),
-            models.Index(fields=["created_at"]),
+            models.Index(fields=["-created_at", "-id"], name="issue_created_id_idx"),
+            models.Index(
+                fields=["cohort", "-created_at"], name="issue_cohort_created_idx"
+            ),
+            models.Index(
+                fields=["reported_by", "-created_at"], name="issue_reporter_created_idx"
+            ),
+            models.Index(
+                fields=["assigned_to", "-created_at"], name="issue_assignee_created_idx"
+            ),
+            models.Index(
+                fields=["cohort", "status", "-created_at"],
+                name="issue_cohort_status_created",
+            ),
+            models.Index(
+                fields=["assigned_to", "status"], name="issue_assigned_status"
+            ),
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status="open"),
+                name="issue_open_created",
+            ),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status and assignee so save() can detect
+        # changes without reading the row again
+        if "status" in field_names and "assigned_to_id" in field_names:
+            instance._stored_state = (instance.status, instance.assigned_to_id)
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop("_stored_state", None)
+
     def save(self, *args, **kwargs):
+        # Use the state loaded with the instance, reading the stored status
+        # and assignee only when it is unknown. The pre_save handler in
+        # apps.notifications.signals reuses them instead of refetching the row.
+        # Saves limited to other columns cannot change either, so they skip it.
+        update_fields = kwargs.get("update_fields")
+        tracks_state = update_fields is None or not self.STATE_FIELDS.isdisjoint(
+            update_fields
+        )
+        if not self.pk:
+            self._stored_state = None
+        elif tracks_state and getattr(self, "_stored_state", None) is None:
+            self._stored_state = (
+                Issue.objects.filter(pk=self.pk)
+                .values_list("status", "assigned_to_id")
+                .first()
+            )
+        stored_state = getattr(self, "_stored_state", None) if tracks_state else None
+
         # Update resolved_at when status changes to RESOLVED
-        if self.pk:
-            old_instance = Issue.objects.filter(pk=self.pk).first()
-            if old_instance and old_instance.status != self.status:
-                if self.status == self.RESOLVED:
-                    from django.utils import timezone
+        if stored_state and stored_state[0] != self.status:
+            from django.utils import timezone
 
-                    self.resolved_at = timezone.now()
+            stamped = []
+            if self.status == self.RESOLVED:
+                self.resolved_at = timezone.now()
+                stamped.append("resolved_at")
 
-                # If changing to IN_PROGRESS and first_response_at is not set
-                if self.status == self.IN_PROGRESS and not self.first_response_at:
-                    from django.utils import timezone
+            # If changing to IN_PROGRESS and first_response_at is not set
+            if self.status == self.IN_PROGRESS and not self.first_response_at:
+                self.first_response_at = timezone.now()
+                stamped.append("first_response_at")
 
-                    self.first_response_at = timezone.now()
+            # Saves limited to some columns still write the timestamps set here
+            if update_fields is not None and stamped:
+                kwargs["update_fields"] = {*update_fields, *stamped}
 
         super().save(*args, **kwargs)
+        if tracks_state:
+            self._stored_state = (self.status, self.assigned_to_id)
 
 
 class Comment(models.Model):
@@ -207,11 +270,13 @@ class IssueHistory(models.Model):
 
     issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name="history")
     action = models.CharField(max_length=255)
+    # History is only ever read per issue, never filtered by user
     performed_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
         null=True,
         related_name="issue_actions",
+        db_index=False,
     )
     timestamp = models.DateTimeField(auto_now_add=True)
 
@@ -258,18 +323,28 @@ class Attachment(models.Model):
     def __str__(self):
         return f"Attachment for Issue #{self.issue.id}: {self.file_name}"
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-uploaded_at"], name="attachment_uploaded_idx"),
+            models.Index(
+                fields=["issue", "-uploaded_at"], name="attachment_issue_uploaded"
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         # Set the file_name if not already set
         if not self.file_name and self.file:
             self.file_name = self.file.name
 
-        # Store file size
-        if self.file and hasattr(self.file, "size"):
-            self.file_size = self.file.size
-
-        # Store content type
-        if self.file and hasattr(self.file, "content_type"):
-            self.content_type = self.file.content_type
+        # Store size and content type from a new upload. Once the file is
+        # committed to storage these columns are the source of truth, so
+        # re-saving never stats (or HEADs) the stored file. Downloads are
+        # served with this type, so it is the sniffed one (already detected
+        # when the upload was validated), never the client's claim.
+        if self.file and not self.file._committed:
+            upload = self.file.file
+            self.file_size = upload.size
+            self.content_type = detect_mime_type(upload)
 
         super().save(*args, **kwargs)
 
@@ -0,0 +1,23 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
+
+
+class IssueCursorPagination(CursorPagination):
+    """
+    Keyset pagination for issue lists.
+
+    Each page continues from the last row of the previous one instead of
+    skipping OFFSET rows, so deep pages cost the same as the first. Clients
+    follow the opaque next/previous links.
+    """
+
+    ordering = ("-created_at", "-id")
+
+    def get_ordering(self, request, queryset, view):
+        # Page full-text matches by rank unless the client picks an ordering
+        if (
+            "search_rank" in queryset.query.annotations
+            and not request.query_params.get(api_settings.ORDERING_PARAM)
+        ):
+            return ("-search_rank", *self.ordering)
+        return super().get_ordering(request, queryset, view)
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Prefetch
 from .models import (
     Course,
     Project,
@@ -13,10 +15,27 @@ from .models import (
 )
 from drf_spectacular.utils import extend_schema_field
 
+from issue_tracker.serializers import CachedFieldsModelSerializer, UpdateFieldsMixin
+
 User = get_user_model()
 
+# Units for human-readable file sizes, one per power of 1024
+FILE_SIZE_UNITS = ("bytes", "KB", "MB", "GB", "TB")
+
+# Display labels for issue choices, keyed by stored value
+ISSUE_STATUS_LABELS = dict(Issue.STATUS_CHOICES)
+ISSUE_CATEGORY_LABELS = dict(Issue.CATEGORY_CHOICES)
+ISSUE_URGENCY_LABELS = dict(Issue.URGENCY_CHOICES)
+
 
-class UserBriefSerializer(serializers.ModelSerializer):
+def full_name(first_name, last_name):
+    """Join a user's first and last name, skipping whichever is blank"""
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return first_name or last_name or ""
+
+
+class UserBriefSerializer(CachedFieldsModelSerializer):
     """
     Simplified serializer for User model to use in nested representations.
     """
@@ -27,11 +46,21 @@ class UserBriefSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "username", "full_name", "role", "cohort"]
 
+    # User columns read by this serializer, for .only() on joined users
+    user_columns = ["id", "username", "first_name", "last_name", "role", "cohort"]
+
     def get_full_name(self, obj):
-        return f"{obj.first_name} {obj.last_name}".strip()
+        return full_name(obj.first_name, obj.last_name)
 
+    @classmethod
+    def related_fields(cls, relation):
+        """
+        Return the .only() lookups for a user joined through `relation`.
+        """
+        return [f"{relation}__{name}" for name in cls.user_columns]
 
-class CourseSerializer(serializers.ModelSerializer):
+
+class CourseSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Course model.
     """
@@ -42,7 +71,7 @@ class CourseSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Project model.
     """
@@ -64,7 +93,7 @@ class ProjectSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at", "course_name"]
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Task model.
     """
@@ -85,7 +114,7 @@ class TaskSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at", "project_name"]
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Comment model.
     """
@@ -103,7 +132,7 @@ class CommentSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["created_at", "updated_at", "user_details"]
+        read_only_fields = ["created_at", "updated_at", "user", "user_details"]
 
     def create(self, validated_data):
         # Set the user to the current user
@@ -111,7 +140,7 @@ class CommentSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class AttachmentSerializer(serializers.ModelSerializer):
+class AttachmentSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Attachment model.
     """
@@ -139,6 +168,7 @@ class AttachmentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = [
             "uploaded_at",
+            "uploaded_by",
             "uploaded_by_username",
             "file_name",
             "file_url",
@@ -147,7 +177,9 @@ class AttachmentSerializer(serializers.ModelSerializer):
             "file_size_display",
         ]
         extra_kwargs = {
-            "file": {"write_only": True}  # Hide actual file path in response
+            "file": {"write_only": True},  # Hide actual file path in response
+            # Load only what AttachmentViewSet.perform_create checks access by
+            "issue": {"queryset": Issue.objects.only("id", "reported_by", "cohort")},
         }
 
     def get_file_url(self, obj):
@@ -165,22 +197,14 @@ class AttachmentSerializer(serializers.ModelSerializer):
         # Handle edge cases
         if size_bytes < 0:
             return "0 bytes"
+        if size_bytes < 1024:
+            return f"{size_bytes} bytes"
 
-        # Define size units
-        units = ["bytes", "KB", "MB", "GB", "TB"]
-        size = float(size_bytes)
-        unit_index = 0
-
-        # Find the appropriate unit
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-
-        # Format with 2 decimal places if not bytes
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.2f} {units[unit_index]}"
+        # Each unit is 2**10 times the previous one
+        unit_index = min((size_bytes.bit_length() - 1) // 10, len(FILE_SIZE_UNITS) - 1)
+        return (
+            f"{size_bytes / (1 << (unit_index * 10)):.2f} {FILE_SIZE_UNITS[unit_index]}"
+        )
 
     def validate_file(self, file):
         """Validate the uploaded file"""
@@ -200,7 +224,7 @@ class AttachmentSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class IssueFeedbackSerializer(serializers.ModelSerializer):
+class IssueFeedbackSerializer(CachedFieldsModelSerializer):
     """
     Serializer for IssueFeedback model.
     """
@@ -211,7 +235,7 @@ class IssueFeedbackSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at"]
 
 
-class IssueHistorySerializer(serializers.ModelSerializer):
+class IssueHistorySerializer(CachedFieldsModelSerializer):
     """
     Serializer for IssueHistory model.
     """
@@ -231,7 +255,7 @@ class IssueHistorySerializer(serializers.ModelSerializer):
         read_only_fields = ["timestamp", "performed_by_details"]
 
 
-class IssueTemplateSerializer(serializers.ModelSerializer):
+class IssueTemplateSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for IssueTemplate model.
     """
@@ -269,7 +293,7 @@ class IssueTemplateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class IssueListSerializer(serializers.ModelSerializer):
+class IssueListSerializer(CachedFieldsModelSerializer):
     """
     Simplified serializer for listing Issues.
     """
@@ -336,16 +360,140 @@ class IssueListSerializer(serializers.ModelSerializer):
             "attachments_count",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join the rendered FKs, count related rows in the same query and load
+        only the columns this serializer reads.
+        """
+        return (
+            queryset.select_related(
+                "course", "project", "task", "reported_by", "assigned_to"
+            )
+            .only(
+                "id",
+                "title",
+                "status",
+                "category",
+                "urgency",
+                "cohort",
+                "week_number",
+                "created_at",
+                "updated_at",
+                "first_response_at",
+                "resolved_at",
+                "course__name",
+                "project__name",
+                "task__title",
+                *UserBriefSerializer.related_fields("reported_by"),
+                *UserBriefSerializer.related_fields("assigned_to"),
+            )
+            .annotate(
+                comments_count=Count("comments", distinct=True),
+                attachments_count=Count("attachments", distinct=True),
+            )
+        )
+
+    # Columns read by values_representation(), one joined row per issue
+    values_fields = (
+        "id",
+        "title",
+        "status",
+        "category",
+        "urgency",
+        "reported_by",
+        "assigned_to",
+        "course",
+        "course__name",
+        "project",
+        "project__name",
+        "task",
+        "task__title",
+        "cohort",
+        "week_number",
+        "created_at",
+        "updated_at",
+        "first_response_at",
+        "resolved_at",
+        "comments_count",
+        "attachments_count",
+        *UserBriefSerializer.related_fields("reported_by"),
+        *UserBriefSerializer.related_fields("assigned_to"),
+    )
+
+    @classmethod
+    def values_representation(cls, row):
+        """
+        Build the same representation as to_representation() from a row of
+        queryset.values(*values_fields), without model instances or fields.
+        """
+        datetime_field = serializers.DateTimeField()
+
+        def user_details(prefix):
+            if row[f"{prefix}__id"] is None:
+                return None
+            return {
+                "id": row[f"{prefix}__id"],
+                "username": row[f"{prefix}__username"],
+                "full_name": full_name(
+                    row[f"{prefix}__first_name"], row[f"{prefix}__last_name"]
+                ),
+                "role": row[f"{prefix}__role"],
+                "cohort": row[f"{prefix}__cohort"],
+            }
+
+        def timestamp(name):
+            value = row[name]
+            return None if value is None else datetime_field.to_representation(value)
+
+        data = {
+            "id": row["id"],
+            "title": row["title"],
+            "status": row["status"],
+            "status_display": ISSUE_STATUS_LABELS.get(row["status"], row["status"]),
+            "category": row["category"],
+            "category_display": ISSUE_CATEGORY_LABELS.get(
+                row["category"], row["category"]
+            ),
+            "urgency": row["urgency"],
+            "urgency_display": ISSUE_URGENCY_LABELS.get(row["urgency"], row["urgency"]),
+            "reported_by": row["reported_by"],
+            "reported_by_details": user_details("reported_by"),
+            "assigned_to": row["assigned_to"],
+            "assigned_to_details": user_details("assigned_to"),
+            "course": row["course"],
+            "course_name": row["course__name"],
+            "project": row["project"],
+            "project_name": row["project__name"],
+            "task": row["task"],
+            "task_title": row["task__title"],
+            "cohort": row["cohort"],
+            "week_number": row["week_number"],
+            "created_at": timestamp("created_at"),
+            "updated_at": timestamp("updated_at"),
+            "first_response_at": timestamp("first_response_at"),
+            "resolved_at": timestamp("resolved_at"),
+            "comments_count": row["comments_count"],
+            "attachments_count": row["attachments_count"],
+        }
+        if row["task"] is None:
+            # DRF skips a dotted source whose relation is null
+            del data["task_title"]
+        return data
+
     @extend_schema_field(serializers.IntegerField())
     def get_comments_count(self, obj):
-        return obj.comments.count()
+        # Prefer the count annotated by setup_eager_loading
+        count = getattr(obj, "comments_count", None)
+        return obj.comments.count() if count is None else count
 
     @extend_schema_field(serializers.IntegerField())
     def get_attachments_count(self, obj):
-        return obj.attachments.count()
+        count = getattr(obj, "attachments_count", None)
+        return obj.attachments.count() if count is None else count
 
 
-class IssueDetailSerializer(serializers.ModelSerializer):
+class IssueDetailSerializer(CachedFieldsModelSerializer):
     """
     Detailed serializer for Issue model with nested relationships.
     """
@@ -419,6 +567,98 @@ class IssueDetailSerializer(serializers.ModelSerializer):
             "feedback",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join and prefetch every relation rendered by this serializer, loading
+        only the columns the nested serializers read.
+        """
+        return (
+            queryset.select_related(
+                "reported_by",
+                "assigned_to",
+                "course",
+                "project__course",
+                "task__project",
+                "feedback",
+            )
+            .only(
+                "id",
+                "title",
+                "description",
+                "status",
+                "category",
+                "urgency",
+                "reported_by",
+                "assigned_to",
+                "course",
+                "project",
+                "task",
+                "cohort",
+                "week_number",
+                "created_at",
+                "updated_at",
+                "first_response_at",
+                "resolved_at",
+                *UserBriefSerializer.related_fields("reported_by"),
+                *UserBriefSerializer.related_fields("assigned_to"),
+                "project__name",
+                "project__week_number",
+                "project__total_tasks",
+                "project__created_at",
+                "project__updated_at",
+                "project__course__name",
+                "task__task_number",
+                "task__title",
+                "task__created_at",
+                "task__updated_at",
+                "task__project__name",
+                "feedback__issue",
+                "feedback__rating",
+                "feedback__comment",
+                "feedback__created_at",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "comments",
+                    queryset=Comment.objects.select_related("user").only(
+                        "id",
+                        "issue",
+                        "user",
+                        "content",
+                        "created_at",
+                        "updated_at",
+                        *UserBriefSerializer.related_fields("user"),
+                    ),
+                ),
+                Prefetch(
+                    "attachments",
+                    queryset=Attachment.objects.select_related("uploaded_by").only(
+                        "id",
+                        "issue",
+                        "file",
+                        "file_name",
+                        "content_type",
+                        "file_size",
+                        "uploaded_by",
+                        "uploaded_at",
+                        "uploaded_by__username",
+                    ),
+                ),
+                Prefetch(
+                    "history",
+                    queryset=IssueHistory.objects.select_related("performed_by").only(
+                        "id",
+                        "issue",
+                        "action",
+                        "performed_by",
+                        "timestamp",
+                        *UserBriefSerializer.related_fields("performed_by"),
+                    ),
+                ),
+            )
+        )
+
 
 class IssueCreateSerializer(serializers.ModelSerializer):
     """
@@ -446,7 +686,7 @@ class IssueCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class IssueUpdateSerializer(serializers.ModelSerializer):
+class IssueUpdateSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating Issues.
     """
@@ -456,6 +696,9 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
         fields = ["status", "assigned_to"]
 
     def update(self, instance, validated_data):
+        user = self.context["request"].user
+        history_entries = []
+
         # Track status changes
         if "status" in validated_data and validated_data["status"] != instance.status:
             # If changing to IN_PROGRESS and first_response_at is not set
@@ -473,25 +716,32 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
 
                 validated_data["resolved_at"] = timezone.now()
 
-            # Create history entry for status change
-            user = self.context["request"].user
-            IssueHistory.objects.create(
-                issue=instance,
-                action=f"Changed status from '{instance.get_status_display()}' to '{dict(Issue.STATUS_CHOICES).get(validated_data['status'])}'",
-                performed_by=user,
+            # Record history entry for status change
+            history_entries.append(
+                IssueHistory(
+                    issue=instance,
+                    action=f"Changed status from '{instance.get_status_display()}' to '{ISSUE_STATUS_LABELS.get(validated_data['status'])}'",
+                    performed_by=user,
+                )
             )
 
         # Track assignment changes
-        if (
-            "assigned_to" in validated_data
-            and validated_data["assigned_to"] != instance.assigned_to
+        new_assignee = validated_data.get("assigned_to")
+        if "assigned_to" in validated_data and (
+            getattr(new_assignee, "pk", None) != instance.assigned_to_id
         ):
-            user = self.context["request"].user
-            new_assignee = validated_data["assigned_to"]
-            IssueHistory.objects.create(
-                issue=instance,
-                action=f"Assigned issue to {new_assignee.username if new_assignee else 'no one'}",
-                performed_by=user,
+            history_entries.append(
+                IssueHistory(
+                    issue=instance,
+                    action=f"Assigned issue to {new_assignee.username if new_assignee else 'no one'}",
+                    performed_by=user,
+                )
             )
 
-        return super().update(instance, validated_data)
+        # Save the issue and its history entries together
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if history_entries:
+                IssueHistory.objects.bulk_create(history_entries)
+
+        return instance
@@ -0,0 +1,36 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .models import Attachment, Comment, Course, Issue, Project, Task
+from .utils import invalidate_issue_list_cache
+
+User = get_user_model()
+
+# Models whose rows appear in issue list responses
+ISSUE_LIST_MODELS = (Issue, Comment, Attachment, Course, Project, Task, User)
+
+# Columns no list renders: saves limited to them (logins, password changes)
+# leave cached lists valid
+UNLISTED_FIELDS = frozenset({"last_login", "password"})
+
+
+def issue_list_changed(sender, **kwargs):
+    """Expire cached issue lists once the change is committed"""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and UNLISTED_FIELDS.issuperset(update_fields):
+        return
+    transaction.on_commit(invalidate_issue_list_cache)
+
+
+for model in ISSUE_LIST_MODELS:
+    post_save.connect(
+        issue_list_changed,
+        sender=model,
+        dispatch_uid=f"issue_list_save_{model.__name__}",
+    )
+    post_delete.connect(
+        issue_list_changed,
+        sender=model,
+        dispatch_uid=f"issue_list_delete_{model.__name__}",
+    )
@@ -1,3 +1,228 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from .models import Course, Project, Task, Issue, Comment, Attachment, IssueFeedback
+from .serializers import IssueFeedbackSerializer
+
+
+class IssueTestData:
+    """Users, curriculum and a few issues shared by the issue API tests"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            "admin", "admin@example.com", "Pass12345!x", role=User.ADMIN
+        )
+        cls.mentor = User.objects.create_user(
+            "mentor", "mentor@example.com", "Pass12345!x", role=User.MENTOR, cohort="C1"
+        )
+        cls.students = [
+            User.objects.create_user(
+                f"student{i}",
+                f"student{i}@example.com",
+                "Pass12345!x",
+                role=User.STUDENT,
+                cohort="C1",
+            )
+            for i in range(3)
+        ]
+        course = Course.objects.create(name="Backend", duration_in_weeks=12)
+        project = Project.objects.create(
+            name="Django", course=course, week_number=1, total_tasks=2
+        )
+        task = Task.objects.create(project=project, task_number=1, title="Models")
+
+        cls.issue = Issue.objects.create(
+            title="Checker fails",
+            description="The checker rejects a correct answer",
+            category=Issue.CHECKER_ERROR,
+            urgency=Issue.HIGH,
+            reported_by=cls.students[0],
+            course=course,
+            project=project,
+            task=task,
+            cohort="C1",
+            week_number=1,
+        )
+        # One assigned, resolved issue without a task, for the nullable columns
+        cls.resolved = resolved = Issue.objects.create(
+            title="Typo in README",
+            description="Spelling",
+            category=Issue.TYPO,
+            reported_by=cls.students[1],
+            assigned_to=cls.mentor,
+            course=course,
+            project=project,
+            cohort="C1",
+            week_number=1,
+        )
+        resolved.status = Issue.IN_PROGRESS
+        resolved.save()
+        resolved.status = Issue.RESOLVED
+        resolved.save()
+
+        for student in cls.students:
+            Comment.objects.create(
+                issue=cls.issue, user=student, content=f"Same here ({student})"
+            )
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+
+@override_settings(ISSUE_LIST_CACHE_TIMEOUT=0)
+class IssueListFastPathTests(IssueTestData, TestCase):
+    """The .values() fast path must render exactly what the serializer does"""
+
+    def assert_same_json(self, user, url):
+        client = self.client_for(user)
+        fast = client.get(url)
+        with override_settings(ISSUE_LIST_VALUES_FAST_PATH=False):
+            slow = client.get(url)
+        self.assertEqual(fast.status_code, 200)
+        self.assertTrue(fast.json()["results"])
+        self.assertEqual(fast.json(), slow.json())
+
+    def test_issue_list(self):
+        self.assert_same_json(self.admin, "/api/issues/")
+
+    def test_filtered_issue_lists(self):
+        self.assert_same_json(self.mentor, "/api/issues/?status=resolved")
+        self.assert_same_json(self.mentor, "/api/issues/assigned_to_me/")
+        self.assert_same_json(self.students[0], "/api/issues/my_issues/")
+
+
+class AttachmentListQueryTests(IssueTestData, TestCase):
+    """The attachment list joins its uploaders instead of querying each"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Stored paths only: the list never opens the files
+        Attachment.objects.bulk_create(
+            Attachment(
+                issue=cls.issue,
+                uploaded_by=student,
+                file=f"attachments/issues/{cls.issue.pk}/log_{student.pk}.txt",
+                file_name=f"log_{student.pk}.txt",
+                content_type="text/plain",
+                file_size=16,
+            )
+            for student in cls.students
+        )
+
+    def test_attachment_list_query_count(self):
+        # A count for the page, then the page joined with its uploaders
+        for user in (self.admin, self.mentor, self.students[0]):
+            with self.subTest(role=user.role), self.assertNumQueries(2):
+                response = self.client_for(user).get("/api/attachments/")
+            self.assertEqual(len(response.json()["results"]), len(self.students))
+
+
+class CommentListQueryTests(IssueTestData, TestCase):
+    """The comment list joins its authors instead of querying each"""
+
+    def test_comment_list_query_count(self):
+        # A count for the page, then the page joined with its authors
+        for user in (self.admin, self.mentor, self.students[0]):
+            with self.subTest(role=user.role), self.assertNumQueries(2):
+                response = self.client_for(user).get("/api/comments/")
+            self.assertEqual(len(response.json()["results"]), len(self.students))
+
+
+@override_settings(ISSUE_LIST_CACHE_TIMEOUT=30)
+class IssueListCacheTests(IssueTestData, TestCase):
+    """Writes through the API expire the cached issue lists they change"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_created_issue_appears_in_cached_list(self):
+        client = self.client_for(self.students[2])
+        self.assertEqual(client.get("/api/issues/my_issues/").json()["results"], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                "/api/issues/",
+                {
+                    "title": "Broken link",
+                    "description": "The project page links to a 404",
+                    "category": Issue.TECHNICAL_ERROR,
+                    "course": self.issue.course_id,
+                    "project": self.issue.project_id,
+                    "cohort": "C1",
+                    "week_number": 1,
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+
+        results = client.get("/api/issues/my_issues/").json()["results"]
+        self.assertEqual([issue["title"] for issue in results], ["Broken link"])
+
+    def test_updated_issue_shows_in_cached_list(self):
+        student = self.client_for(self.students[0])
+        (cached,) = student.get("/api/issues/my_issues/").json()["results"]
+        self.assertEqual(cached["status"], Issue.OPEN)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client_for(self.mentor).patch(
+                f"/api/issues/{self.issue.pk}/",
+                {"status": Issue.IN_PROGRESS},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 200)
+
+        (updated,) = student.get("/api/issues/my_issues/").json()["results"]
+        self.assertEqual(updated["status"], Issue.IN_PROGRESS)
+
+
+class IssueFeedbackTests(IssueTestData, TestCase):
+    """Each resolved issue takes one feedback, from its reporter"""
+
+    def post_feedback(self, user, issue, rating=5):
+        return self.client_for(user).post(
+            f"/api/issues/{issue.pk}/add_feedback/", {"rating": rating}, format="json"
+        )
+
+    def test_reporter_adds_feedback_once(self):
+        response = self.post_feedback(self.students[1], self.resolved)
+        self.assertEqual(response.status_code, 201)
+
+        response = self.post_feedback(self.students[1], self.resolved, rating=1)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"detail": "Feedback already exists for this issue."}
+        )
+        self.assertEqual(IssueFeedback.objects.get(issue=self.resolved).rating, 5)
+
+    def test_concurrent_feedback_hits_unique_constraint(self):
+        # Another request inserts its feedback between the duplicate check
+        # and this save; the constraint's IntegrityError is the same 400
+        save = IssueFeedbackSerializer.save
+
+        def racing_save(serializer, **kwargs):
+            IssueFeedback.objects.create(issue=self.resolved, rating=1)
+            return save(serializer, **kwargs)
+
+        with mock.patch.object(IssueFeedbackSerializer, "save", racing_save):
+            response = self.post_feedback(self.students[1], self.resolved)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"detail": "Feedback already exists for this issue."}
+        )
+
+    def test_only_reporter_of_resolved_issue(self):
+        self.assertEqual(
+            self.post_feedback(self.mentor, self.resolved).status_code, 403
+        )
+        self.assertEqual(
+            self.post_feedback(self.students[0], self.issue).status_code, 400
+        )
+        self.assertFalse(IssueFeedback.objects.exists())
@@ -1,10 +1,56 @@
+import hashlib
 import os
-import uuid
+import secrets
 import magic
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils.text import slugify
 
+from issue_tracker.cache import bump_version, current_version
+
+# A single libmagic handle, loaded once per process instead of once per upload
+_MIME_DETECTOR = magic.Magic(mime=True)
+
+# Allowed types resolved once at import time for O(1) membership checks
+_ALLOWED_MIMES = frozenset(settings.ALLOWED_MIME_TYPES)
+_ALLOWED_EXTS = frozenset(ext.lower() for ext in settings.ALLOWED_FILE_EXTENSIONS)
+_ALLOWED_EXTS_STR = ", ".join(dict.fromkeys(settings.ALLOWED_FILE_EXTENSIONS))
+_ALLOWED_EXT_SUFFIXES = tuple(f".{ext}" for ext in _ALLOWED_EXTS)
+
+# MIME types libmagic reports for genuine files of each extension. Plain-text
+# formats are often sniffed as text/plain, and OOXML/ODF documents as zip.
+_KNOWN_EXT_MIMES = {
+    "jpg": {"image/jpeg"},
+    "jpeg": {"image/jpeg"},
+    "png": {"image/png"},
+    "gif": {"image/gif"},
+    "bmp": {"image/bmp"},
+    "svg": {"image/svg+xml"},
+    "pdf": {"application/pdf"},
+    "doc": {"application/msword"},
+    "docx": {
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/zip",
+    },
+    "txt": {"text/plain"},
+    "rtf": {"application/rtf"},
+    "odt": {"application/vnd.oasis.opendocument.text", "application/zip"},
+    "py": {"text/x-python", "text/plain"},
+    "js": {"application/javascript", "text/plain"},
+    "html": {"text/html"},
+    "css": {"text/css", "text/plain"},
+    "json": {"application/json", "text/plain"},
+    "log": {"text/plain"},
+    "zip": {"application/zip"},
+}
+
+# Allowed extension -> MIME types accepted for it, restricted to the allowed
+# MIME types. Extensions without a known mapping accept any allowed type.
+_EXT_TO_MIMES = {
+    ext: frozenset(_KNOWN_EXT_MIMES.get(ext, _ALLOWED_MIMES)) & _ALLOWED_MIMES
+    for ext in _ALLOWED_EXTS
+}
+
 
 def validate_file_size(file):
     """
@@ -17,29 +63,48 @@ def validate_file_size(file):
         )
 
 
-def validate_file_type(file):
+def detect_mime_type(file):
     """
-    Validate that the file is of an allowed type using python-magic.
+    Return the file's MIME type as libmagic detects it from the first 2048
+    bytes, ignoring whatever type the client declared. The result is kept
+    on the file, so validating and saving an upload sniff it once.
     """
-    # Read the first 2048 bytes to determine file type
-    file_header = file.read(2048)
-    file.seek(0)  # Reset file pointer
+    mime = getattr(file, "detected_content_type", None)
+    if mime is None:
+        file_header = file.read(2048)
+        file.seek(0)  # Reset file pointer
+        mime = file.detected_content_type = _MIME_DETECTOR.from_buffer(file_header)
+    return mime
 
-    # Use python-magic to detect MIME type
-    mime = magic.from_buffer(file_header, mime=True)
 
-    if mime not in settings.ALLOWED_MIME_TYPES:
-        raise ValidationError(
-            f"File type '{mime}' is not allowed. Please upload a file with one of the following types: "
-            f"{', '.join(settings.ALLOWED_FILE_EXTENSIONS)}"
-        )
+def validate_file_type(file):
+    """
+    Validate that the file is of an allowed type using python-magic.
 
-    # Double-check extension as well
-    ext = os.path.splitext(file.name)[1][1:].lower()
-    if ext not in settings.ALLOWED_FILE_EXTENSIONS:
+    The extension is checked first so disallowed files are rejected without
+    reading them; the sniffed MIME type must then match that extension.
+    """
+    name = file.name.lower()
+    if not name.endswith(_ALLOWED_EXT_SUFFIXES):
+        ext = os.path.splitext(name)[1][1:]
         raise ValidationError(
             f"File extension '{ext}' is not allowed. Please upload a file with one of the following extensions: "
-            f"{', '.join(settings.ALLOWED_FILE_EXTENSIONS)}"
+            f"{_ALLOWED_EXTS_STR}"
+        )
+    ext = name.rpartition(".")[2]
+    expected_mimes = _EXT_TO_MIMES[ext]
+
+    mime = detect_mime_type(file)
+    if mime not in expected_mimes:
+        # An allowed type under the wrong extension (e.g. a PDF named .png)
+        if mime in _ALLOWED_MIMES:
+            raise ValidationError(
+                f"File content ('{mime}') does not match the '.{ext}' extension. "
+                "Please upload the file with its correct extension."
+            )
+        raise ValidationError(
+            f"File type '{mime}' is not allowed. Please upload a file with one of the following types: "
+            f"{_ALLOWED_EXTS_STR}"
         )
 
 
@@ -50,15 +115,13 @@ def sanitize_filename(filename):
     # Get name and extension
     name, ext = os.path.splitext(filename)
 
-    # Slugify the name to remove special characters
-    name = slugify(name)
+    # Slugify the name to remove special characters, bounding the input
+    # first so pathological names don't cost more than the kept prefix,
+    # then truncate to at most 100 chars
+    name = slugify(name[:150], allow_unicode=False)[:100]
 
-    # Truncate name if too long (max 100 chars)
-    if len(name) > 100:
-        name = name[:100]
-
-    # Add a UUID to ensure uniqueness
-    unique_name = f"{name}_{uuid.uuid4().hex[:8]}{ext}"
+    # Add a random suffix to ensure uniqueness
+    unique_name = f"{name}_{secrets.token_hex(4)}{ext}"
 
     return unique_name
 
@@ -75,3 +138,29 @@ def get_safe_file_path(instance, filename):
 
     # Return the path
     return f"attachments/issues/{issue_id}/{clean_filename}"
+
+
+ISSUE_LIST_CACHE_VERSION_KEY = "issues:list:version"
+
+
+def issue_list_cache_key(request, action):
+    """
+    Build the cache key for an issue list response.
+
+    The key covers everything the response depends on: the list version,
+    the action, the requesting user's scope and the full URL (query string
+    filters and pagination links).
+    """
+    version = current_version(ISSUE_LIST_CACHE_VERSION_KEY)
+    user = request.user
+    url = hashlib.blake2b(
+        request.build_absolute_uri().encode(), digest_size=8
+    ).hexdigest()
+    return f"issues:list:{version}:{action}:{user.pk}:{user.role}:{user.cohort}:{url}"
+
+
+def invalidate_issue_list_cache():
+    """
+    Expire every cached issue list response by bumping the list version.
+    """
+    bump_version(ISSUE_LIST_CACHE_VERSION_KEY)
@@ -1,8 +1,21 @@
-from rest_framework import viewsets, permissions, status, filters, serializers
+from rest_framework import (
+    viewsets,
+    generics,
+    permissions,
+    status,
+    filters,
+    serializers,
+)
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.http import content_disposition_header
+from urllib.parse import quote
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.core.exceptions import PermissionDenied
 from drf_spectacular.utils import (
@@ -12,6 +25,7 @@ from drf_spectacular.utils import (
     OpenApiResponse,
 )
 from drf_spectacular.types import OpenApiTypes
+from issue_tracker.schema import FORBIDDEN, INVALID_DATA, UNAUTHENTICATED
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from .models import (
@@ -38,6 +52,15 @@ from .serializers import (
     AttachmentSerializer,
     IssueTemplateSerializer,
 )
+from .filters import (
+    ProjectFilterSet,
+    TaskFilterSet,
+    IssueFilterSet,
+    IssueSearchFilter,
+    IssueOrderingFilter,
+)
+from .pagination import IssueCursorPagination
+from .utils import issue_list_cache_key
 from apps.users.permissions import (
     IsAdmin,
     IsMentor,
@@ -48,6 +71,49 @@ from apps.users.permissions import (
 
 User = get_user_model()
 
+# Permission classes are stateless, so each viewset returns shared instances
+# instead of building new ones on every request
+_READ = (permissions.IsAuthenticated(),)
+_ADMIN_WRITE = (*_READ, IsAdmin())
+_OWNER_WRITE = (*_READ, IsOwnerOrMentorOrAdmin())
+_MENTOR_WRITE = (*_READ, IsMentorOrAdmin())
+
+# Schema response shared by the issue actions
+ISSUE_NOT_FOUND = OpenApiResponse(description="Issue not found.")
+
+# Read size for streamed attachment downloads
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+
+_WRITE_ACTIONS = frozenset({"create", "update", "partial_update", "destroy"})
+_CHANGE_ACTIONS = frozenset({"update", "partial_update", "destroy"})
+_UPDATE_ACTIONS = frozenset({"update", "partial_update"})
+
+
+def _resolve_role(request):
+    """
+    Resolve the requesting user's role and cohort once per request.
+    """
+    if not hasattr(request, "_issue_role"):
+        request._issue_role = (request.user.role, request.user.cohort)
+    return request._issue_role
+
+
+def _issue_scope(request, relation=""):
+    """
+    Return the Q limiting rows to issues the requesting user may see.
+
+    Students see the issues they reported, mentors the issues of their
+    cohort and admins everything. `relation` is the lookup prefix from the
+    queried model to its issue (e.g. "issue__"), so every viewset applies
+    the same policy through one filter.
+    """
+    role, cohort = _resolve_role(request)
+    if role == User.STUDENT:
+        return Q(**{f"{relation}reported_by": request.user})
+    if role == User.MENTOR:
+        return Q(**{f"{relation}cohort": cohort})
+    return Q()
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -55,9 +121,7 @@ User = get_user_model()
         description="List all courses in the curriculum.",
         responses={
             200: CourseSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     retrieve=extend_schema(
@@ -65,9 +129,7 @@ User = get_user_model()
         description="Retrieve details of a specific course.",
         responses={
             200: CourseSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             404: OpenApiResponse(description="Course not found."),
         },
     ),
@@ -76,13 +138,9 @@ User = get_user_model()
         description="Create a new course. Only accessible to admins.",
         responses={
             201: CourseSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
         },
     ),
     update=extend_schema(
@@ -90,13 +148,9 @@ User = get_user_model()
         description="Update a course. Only accessible to admins.",
         responses={
             200: CourseSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Course not found."),
         },
     ),
@@ -105,13 +159,9 @@ User = get_user_model()
         description="Partially update a course. Only accessible to admins.",
         responses={
             200: CourseSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Course not found."),
         },
     ),
@@ -120,12 +170,8 @@ User = get_user_model()
         description="Delete a course. Only accessible to admins.",
         responses={
             204: OpenApiResponse(description="Course deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Course not found."),
         },
     ),
@@ -143,9 +189,7 @@ class CourseViewSet(viewsets.ModelViewSet):
     ordering = ["name"]
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
-            return [permissions.IsAuthenticated(), IsAdmin()]
-        return [permissions.IsAuthenticated()]
+        return _ADMIN_WRITE if self.action in _WRITE_ACTIONS else _READ
 
 
 @extend_schema_view(
@@ -168,9 +212,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         ],
         responses={
             200: ProjectSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     retrieve=extend_schema(
@@ -178,9 +220,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         description="Retrieve details of a specific project.",
         responses={
             200: ProjectSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             404: OpenApiResponse(description="Project not found."),
         },
     ),
@@ -189,13 +229,9 @@ class CourseViewSet(viewsets.ModelViewSet):
         description="Create a new project. Only accessible to admins.",
         responses={
             201: ProjectSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
         },
     ),
     update=extend_schema(
@@ -203,13 +239,9 @@ class CourseViewSet(viewsets.ModelViewSet):
         description="Update a project. Only accessible to admins.",
         responses={
             200: ProjectSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Project not found."),
         },
     ),
@@ -218,13 +250,9 @@ class CourseViewSet(viewsets.ModelViewSet):
         description="Partially update a project. Only accessible to admins.",
         responses={
             200: ProjectSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Project not found."),
         },
     ),
@@ -233,12 +261,8 @@ class CourseViewSet(viewsets.ModelViewSet):
         description="Delete a project. Only accessible to admins.",
         responses={
             204: OpenApiResponse(description="Project deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Project not found."),
         },
     ),
@@ -255,15 +279,13 @@ class ProjectViewSet(viewsets.ModelViewSet):
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["course", "week_number"]
+    filterset_class = ProjectFilterSet
     search_fields = ["name"]
     ordering_fields = ["name", "course", "week_number", "created_at"]
     ordering = ["course", "week_number"]
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
-            return [permissions.IsAuthenticated(), IsAdmin()]
-        return [permissions.IsAuthenticated()]
+        return _ADMIN_WRITE if self.action in _WRITE_ACTIONS else _READ
 
 
 @extend_schema_view(
@@ -286,9 +308,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         ],
         responses={
             200: TaskSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     retrieve=extend_schema(
@@ -296,9 +316,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         description="Retrieve details of a specific task.",
         responses={
             200: TaskSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             404: OpenApiResponse(description="Task not found."),
         },
     ),
@@ -307,13 +325,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
         description="Create a new task. Only accessible to admins.",
         responses={
             201: TaskSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
         },
     ),
     update=extend_schema(
@@ -321,13 +335,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
         description="Update a task. Only accessible to admins.",
         responses={
             200: TaskSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Task not found."),
         },
     ),
@@ -336,13 +346,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
         description="Partially update a task. Only accessible to admins.",
         responses={
             200: TaskSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Task not found."),
         },
     ),
@@ -351,12 +357,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
         description="Delete a task. Only accessible to admins.",
         responses={
             204: OpenApiResponse(description="Task deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
             404: OpenApiResponse(description="Task not found."),
         },
     ),
@@ -373,15 +375,13 @@ class TaskViewSet(viewsets.ModelViewSet):
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
-    filterset_fields = ["project", "task_number"]
+    filterset_class = TaskFilterSet
     search_fields = ["title"]
     ordering_fields = ["project", "task_number", "created_at"]
     ordering = ["project", "task_number"]
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
-            return [permissions.IsAuthenticated(), IsAdmin()]
-        return [permissions.IsAuthenticated()]
+        return _ADMIN_WRITE if self.action in _WRITE_ACTIONS else _READ
 
 
 @extend_schema_view(
@@ -483,9 +483,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         ],
         responses={
             200: IssueListSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     create=extend_schema(
@@ -494,10 +492,8 @@ class TaskViewSet(viewsets.ModelViewSet):
         request=IssueCreateSerializer,
         responses={
             201: IssueDetailSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
         },
     ),
     retrieve=extend_schema(
@@ -505,13 +501,11 @@ class TaskViewSet(viewsets.ModelViewSet):
         description="Retrieve details of a specific issue.",
         responses={
             200: IssueDetailSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to access this issue."
             ),
-            404: OpenApiResponse(description="Issue not found."),
+            404: ISSUE_NOT_FOUND,
         },
     ),
     update=extend_schema(
@@ -520,14 +514,12 @@ class TaskViewSet(viewsets.ModelViewSet):
         request=IssueUpdateSerializer,
         responses={
             200: IssueDetailSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this issue."
             ),
-            404: OpenApiResponse(description="Issue not found."),
+            404: ISSUE_NOT_FOUND,
         },
     ),
     partial_update=extend_schema(
@@ -536,14 +528,12 @@ class TaskViewSet(viewsets.ModelViewSet):
         request=IssueUpdateSerializer,
         responses={
             200: IssueDetailSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this issue."
             ),
-            404: OpenApiResponse(description="Issue not found."),
+            404: ISSUE_NOT_FOUND,
         },
     ),
     destroy=extend_schema(
@@ -551,13 +541,11 @@ class TaskViewSet(viewsets.ModelViewSet):
         description="Delete an issue. Only accessible to admins.",
         responses={
             204: OpenApiResponse(description="Issue deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to delete this issue."
             ),
-            404: OpenApiResponse(description="Issue not found."),
+            404: ISSUE_NOT_FOUND,
         },
     ),
 )
@@ -569,38 +557,41 @@ class IssueViewSet(viewsets.ModelViewSet):
     queryset = Issue.objects.all()
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
-    filterset_fields = [
-        "status",
-        "category",
-        "urgency",
-        "course",
-        "project",
-        "task",
-        "cohort",
-        "week_number",
-        "reported_by",
-        "assigned_to",
+        IssueSearchFilter,
+        IssueOrderingFilter,
     ]
+    filterset_class = IssueFilterSet
     search_fields = ["title", "description"]
     ordering_fields = ["created_at", "updated_at", "status", "urgency"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = IssueCursorPagination
 
     def get_queryset(self):
         user = self.request.user
+        role, cohort = _resolve_role(self.request)
         queryset = super().get_queryset()
 
-        # Students can only see their own issues
-        if user.is_student():
-            queryset = queryset.filter(reported_by=user)
+        # Anyone can see the issues assigned to them
+        if self.action == "assigned_to_me":
+            queryset = queryset.filter(assigned_to=user)
+            if role == User.MENTOR:
+                queryset = queryset.filter(cohort=cohort)
+
+        # Otherwise students see their own issues, mentors their cohort's
+        # and admins all of them
+        else:
+            queryset = queryset.filter(_issue_scope(self.request))
 
-        # Mentors can see issues from their cohort
-        elif user.is_mentor():
-            queryset = queryset.filter(cohort=user.cohort)
+        # Students' issues are already limited to the ones they reported
+        if self.action == "my_issues" and role != User.STUDENT:
+            queryset = queryset.filter(reported_by=user)
 
-        # Admins can see all issues (default queryset)
+        # Shape the queryset for what each action renders. Other actions
+        # (updates, comments, feedback, deletion) only fetch the one row.
+        if self.action in ["list", "my_issues", "assigned_to_me"]:
+            queryset = IssueListSerializer.setup_eager_loading(queryset)
+        elif self.action == "retrieve":
+            queryset = IssueDetailSerializer.setup_eager_loading(queryset)
 
         return queryset
 
@@ -615,19 +606,83 @@ class IssueViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         if self.action == "destroy":
-            return [permissions.IsAuthenticated(), IsAdmin()]
-        elif self.action in ["update", "partial_update"]:
-            return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
-        return [permissions.IsAuthenticated()]
+            return _ADMIN_WRITE
+        elif self.action in _UPDATE_ACTIONS:
+            return _OWNER_WRITE
+        return _READ
+
+    def list(self, request, *args, **kwargs):
+        return self.list_response(self.get_queryset())
+
+    def get_issue_state(self):
+        """
+        Fetch the id, reporter, cohort and status of the issue in the URL.
+
+        The lookup is scoped by get_queryset() like get_object(), so issues
+        outside the user's scope are a 404, but it reads four columns instead
+        of building an Issue. For actions that only attach a row to the issue.
+        """
+        queryset = (
+            self.get_queryset()
+            .order_by()
+            .values("id", "reported_by_id", "cohort", "status")
+        )
+        return generics.get_object_or_404(queryset, pk=self.kwargs[self.lookup_field])
+
+    def list_response(self, queryset):
+        """
+        Filter, paginate and render issues in the IssueListSerializer format.
+
+        Responses are cached per user and URL for ISSUE_LIST_CACHE_TIMEOUT
+        seconds; any change to the listed data expires them (see signals).
+        """
+        timeout = settings.ISSUE_LIST_CACHE_TIMEOUT
+        if not timeout:
+            return Response(self.list_data(queryset))
+
+        cache_key = issue_list_cache_key(self.request, self.action)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.list_data(queryset)
+            cache.set(cache_key, data, timeout)
+        return Response(data)
+
+    def list_data(self, queryset):
+        """
+        Filter, paginate and serialize issues, returning the response data.
+
+        With ISSUE_LIST_VALUES_FAST_PATH enabled, rows are read with .values()
+        and rendered without building model instances or serializer fields.
+        """
+        queryset = self.filter_queryset(queryset)
+
+        if settings.ISSUE_LIST_VALUES_FAST_PATH:
+            fields = IssueListSerializer.values_fields
+            if "search_rank" in queryset.query.annotations:
+                # The cursor pagination reads the rank from each row
+                fields = (*fields, "search_rank")
+            rows = queryset.values(*fields)
+            page = self.paginate_queryset(rows)
+            data = [
+                IssueListSerializer.values_representation(row)
+                for row in (rows if page is None else page)
+            ]
+        else:
+            page = self.paginate_queryset(queryset)
+            data = IssueListSerializer(
+                queryset if page is None else page, many=True
+            ).data
+
+        if page is not None:
+            return self.get_paginated_response(data).data
+        return data
 
     @extend_schema(
         summary="My issues",
         description="List issues reported by the current user.",
         responses={
             200: IssueListSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     )
     @action(detail=False, methods=["get"])
@@ -635,25 +690,14 @@ class IssueViewSet(viewsets.ModelViewSet):
         """
         List issues reported by the current user.
         """
-        queryset = self.get_queryset().filter(reported_by=request.user)
-        queryset = self.filter_queryset(queryset)
-        page = self.paginate_queryset(queryset)
-
-        if page is not None:
-            serializer = IssueListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = IssueListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.list_response(self.get_queryset())
 
     @extend_schema(
         summary="Assigned issues",
         description="List issues assigned to the current user.",
         responses={
             200: IssueListSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     )
     @action(detail=False, methods=["get"])
@@ -661,16 +705,7 @@ class IssueViewSet(viewsets.ModelViewSet):
         """
         List issues assigned to the current user.
         """
-        queryset = self.get_queryset().filter(assigned_to=request.user)
-        queryset = self.filter_queryset(queryset)
-        page = self.paginate_queryset(queryset)
-
-        if page is not None:
-            serializer = IssueListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = IssueListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.list_response(self.get_queryset())
 
     @extend_schema(
         summary="Add comment to issue",
@@ -678,11 +713,9 @@ class IssueViewSet(viewsets.ModelViewSet):
         request=CommentSerializer,
         responses={
             201: CommentSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            404: OpenApiResponse(description="Issue not found."),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            404: ISSUE_NOT_FOUND,
         },
     )
     @action(detail=True, methods=["post"])
@@ -690,9 +723,9 @@ class IssueViewSet(viewsets.ModelViewSet):
         """
         Add a comment to an issue.
         """
-        issue = self.get_object()
+        issue = self.get_issue_state()
         serializer = CommentSerializer(
-            data={"issue": issue.id, "content": request.data.get("content")},
+            data={"issue": issue["id"], "content": request.data.get("content")},
             context={"request": request},
         )
         serializer.is_valid(raise_exception=True)
@@ -708,11 +741,9 @@ class IssueViewSet(viewsets.ModelViewSet):
             400: OpenApiResponse(
                 description="Bad request - invalid data or issue not resolved."
             ),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(description="Only the reporter can add feedback."),
-            404: OpenApiResponse(description="Issue not found."),
+            404: ISSUE_NOT_FOUND,
         },
     )
     @action(detail=True, methods=["post"])
@@ -720,38 +751,53 @@ class IssueViewSet(viewsets.ModelViewSet):
         """
         Add feedback to a resolved issue.
         """
-        issue = self.get_object()
-
-        # Check if user is the reporter
-        if issue.reported_by != request.user:
-            return Response(
-                {"detail": "Only the reporter can add feedback."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        # Check if issue is resolved
-        if issue.status != Issue.RESOLVED:
-            return Response(
-                {"detail": "Feedback can only be added to resolved issues."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Check if feedback already exists
-        if hasattr(issue, "feedback"):
-            return Response(
-                {"detail": "Feedback already exists for this issue."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        serializer = IssueFeedbackSerializer(
-            data={
-                "issue": issue.id,
-                "rating": request.data.get("rating"),
-                "comment": request.data.get("comment", ""),
-            },
+        already_exists = Response(
+            {"detail": "Feedback already exists for this issue."},
+            status=status.HTTP_400_BAD_REQUEST,
         )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+
+        # Read the issue with its row locked and check that copy, so a
+        # concurrent reopen or second submission waits for this one; the
+        # unique constraint still backs up the duplicate check
+        try:
+            with transaction.atomic():
+                issue = generics.get_object_or_404(
+                    self.get_queryset()
+                    .order_by()
+                    .select_for_update()
+                    .values("id", "reported_by_id", "status"),
+                    pk=self.kwargs[self.lookup_field],
+                )
+
+                # Check if user is the reporter
+                if issue["reported_by_id"] != request.user.pk:
+                    return Response(
+                        {"detail": "Only the reporter can add feedback."},
+                        status=status.HTTP_403_FORBIDDEN,
+                    )
+
+                # Check if issue is resolved
+                if issue["status"] != Issue.RESOLVED:
+                    return Response(
+                        {"detail": "Feedback can only be added to resolved issues."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # Check if feedback already exists
+                if IssueFeedback.objects.filter(issue_id=issue["id"]).exists():
+                    return already_exists
+
+                serializer = IssueFeedbackSerializer(
+                    data={
+                        "issue": issue["id"],
+                        "rating": request.data.get("rating"),
+                        "comment": request.data.get("comment", ""),
+                    },
+                )
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+        except IntegrityError:
+            return already_exists
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @extend_schema(
@@ -771,13 +817,9 @@ class IssueViewSet(viewsets.ModelViewSet):
             400: OpenApiResponse(
                 description="Bad request - issue not resolved or invalid data."
             ),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
-            404: OpenApiResponse(description="Issue not found."),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
+            404: ISSUE_NOT_FOUND,
         },
     )
     @action(
@@ -847,9 +889,7 @@ class IssueViewSet(viewsets.ModelViewSet):
         ],
         responses={
             200: CommentSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     create=extend_schema(
@@ -857,10 +897,8 @@ class IssueViewSet(viewsets.ModelViewSet):
         description="Add a comment to an issue.",
         responses={
             201: CommentSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
         },
     ),
     retrieve=extend_schema(
@@ -868,9 +906,7 @@ class IssueViewSet(viewsets.ModelViewSet):
         description="Retrieve a specific comment.",
         responses={
             200: CommentSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             404: OpenApiResponse(description="Comment not found."),
         },
     ),
@@ -879,10 +915,8 @@ class IssueViewSet(viewsets.ModelViewSet):
         description="Update a comment. Users can only update their own comments, mentors and admins can update any comment.",
         responses={
             200: CommentSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this comment."
             ),
@@ -894,10 +928,8 @@ class IssueViewSet(viewsets.ModelViewSet):
         description="Partially update a comment. Users can only update their own comments, mentors and admins can update any comment.",
         responses={
             200: CommentSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this comment."
             ),
@@ -909,9 +941,7 @@ class IssueViewSet(viewsets.ModelViewSet):
         description="Delete a comment. Users can only delete their own comments, mentors and admins can delete any comment.",
         responses={
             204: OpenApiResponse(description="Comment deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to delete this comment."
             ),
@@ -932,25 +962,18 @@ class CommentViewSet(viewsets.ModelViewSet):
     ordering = ["created_at"]
 
     def get_queryset(self):
-        user = self.request.user
-        queryset = super().get_queryset()
-
-        # Students can only see comments on their own issues
-        if user.is_student():
-            queryset = queryset.filter(issue__reported_by=user)
-
-        # Mentors can see comments from their cohort
-        elif user.is_mentor():
-            queryset = queryset.filter(issue__cohort=user.cohort)
-
-        # Admins can see all comments (default queryset)
+        # Comments are visible with the issue they belong to
+        queryset = (
+            super()
+            .get_queryset()
+            .filter(_issue_scope(self.request, relation="issue__"))
+        )
 
-        return queryset
+        # Join the author rendered in user_details
+        return queryset.select_related("user")
 
     def get_permissions(self):
-        if self.action in ["update", "partial_update", "destroy"]:
-            return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
-        return [permissions.IsAuthenticated()]
+        return _OWNER_WRITE if self.action in _CHANGE_ACTIONS else _READ
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -976,9 +999,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         ],
         responses={
             200: AttachmentSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     create=extend_schema(
@@ -987,9 +1008,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         responses={
             201: AttachmentSerializer,
             400: OpenApiResponse(description="Bad request - invalid data or file."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             413: OpenApiResponse(
                 description="File size exceeds the maximum allowed size."
             ),
@@ -1000,9 +1019,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         description="Retrieve attachment details. The actual file can be downloaded using the file_url property.",
         responses={
             200: AttachmentSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to access this attachment."
             ),
@@ -1014,9 +1031,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         description="Delete an attachment. Users can only delete their own attachments, mentors and admins can delete any attachment.",
         responses={
             204: OpenApiResponse(description="Attachment deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to delete this attachment."
             ),
@@ -1046,42 +1061,30 @@ class AttachmentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = super().get_queryset()
+        scope = _issue_scope(self.request, relation="issue__")
 
-        # Students can only see attachments on their own issues or that they uploaded
-        if user.is_student():
-            queryset = queryset.filter(Q(issue__reported_by=user) | Q(uploaded_by=user))
+        # Students also see the attachments they uploaded themselves
+        if _resolve_role(self.request)[0] == User.STUDENT:
+            scope |= Q(uploaded_by=user)
 
-        # Mentors can see attachments from their cohort
-        elif user.is_mentor():
-            queryset = queryset.filter(issue__cohort=user.cohort)
+        queryset = super().get_queryset().filter(scope)
 
-        # Admins can see all attachments (default queryset)
-
-        return queryset
+        # Join the uploader rendered in uploaded_by_username
+        return queryset.select_related("uploaded_by")
 
     def get_permissions(self):
-        if self.action == "destroy":
-            return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
-        return [permissions.IsAuthenticated()]
+        return _OWNER_WRITE if self.action == "destroy" else _READ
 
     def perform_create(self, serializer):
         """Set the current user as uploader and validate issue access"""
-        issue_id = self.request.data.get("issue")
-        if not issue_id:
-            raise serializers.ValidationError({"issue": "Issue ID is required."})
-
-        # Check if issue exists and user has access
-        try:
-            issue = Issue.objects.get(pk=issue_id)
-        except Issue.DoesNotExist:
-            raise serializers.ValidationError({"issue": "Issue does not exist."})
+        # The serializer has already resolved (and required) the issue
+        issue = serializer.validated_data["issue"]
 
         # Check permissions
         user = self.request.user
 
         # Students can only attach files to their own issues
-        if user.is_student() and issue.reported_by != user:
+        if user.is_student() and issue.reported_by_id != user.pk:
             raise PermissionDenied("You can only attach files to your own issues.")
 
         # Mentors can only attach files to issues in their cohort
@@ -1097,9 +1100,7 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         description="Download the actual file attachment.",
         responses={
             200: OpenApiResponse(description="File will be downloaded."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to access this file."
             ),
@@ -1112,28 +1113,42 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         Download the attachment file directly.
         """
         attachment = self.get_object()
+        not_found = Response(
+            {"detail": "File not found."}, status=status.HTTP_404_NOT_FOUND
+        )
 
-        # Check if file exists
-        if not attachment.file or not os.path.exists(attachment.file.path):
-            return Response(
-                {"detail": "File not found."}, status=status.HTTP_404_NOT_FOUND
+        # Opening through the storage is the existence check
+        if not attachment.file:
+            return not_found
+
+        # Let nginx send the bytes from an internal location
+        accel_prefix = settings.ATTACHMENT_ACCEL_REDIRECT_PREFIX
+        if accel_prefix:
+            response = HttpResponse(
+                content_type=attachment.content_type or "application/octet-stream"
+            )
+            response["Content-Disposition"] = content_disposition_header(
+                True, attachment.file_name
             )
+            response["X-Accel-Redirect"] = (
+                f"{accel_prefix.rstrip('/')}/{quote(attachment.file.name)}"
+            )
+            return response
 
-        # Generate a response with the file
-        file_path = attachment.file.path
-        file_name = attachment.file_name
-        content_type = attachment.content_type or "application/octet-stream"
+        try:
+            file = attachment.file.open("rb")
+        except FileNotFoundError:
+            return not_found
 
+        # FileResponse sets Content-Length from the open handle and streams
+        # it in blocks (or hands it to the server's wsgi.file_wrapper)
         response = FileResponse(
-            open(file_path, "rb"),
-            content_type=content_type,
+            file,
+            content_type=attachment.content_type or "application/octet-stream",
             as_attachment=True,
-            filename=file_name,
+            filename=attachment.file_name,
         )
-
-        # Add Content-Length header
-        response["Content-Length"] = os.path.getsize(file_path)
-
+        response.block_size = DOWNLOAD_BLOCK_SIZE
         return response
 
 
@@ -1164,9 +1179,7 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         ],
         responses={
             200: IssueTemplateSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     create=extend_schema(
@@ -1174,10 +1187,8 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         description="Create a template for issue creation. Only accessible to mentors and admins.",
         responses={
             201: IssueTemplateSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to create templates."
             ),
@@ -1188,9 +1199,7 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         description="Retrieve a specific issue template.",
         responses={
             200: IssueTemplateSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             404: OpenApiResponse(description="Template not found."),
         },
     ),
@@ -1199,10 +1208,8 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         description="Update an issue template. Only the creator, mentors, and admins can update templates.",
         responses={
             200: IssueTemplateSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this template."
             ),
@@ -1214,10 +1221,8 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         description="Partially update an issue template. Only the creator, mentors, and admins can update templates.",
         responses={
             200: IssueTemplateSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this template."
             ),
@@ -1229,9 +1234,7 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         description="Delete an issue template. Only the creator, mentors, and admins can delete templates.",
         responses={
             204: OpenApiResponse(description="Template deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to delete this template."
             ),
@@ -1258,10 +1261,10 @@ class IssueTemplateViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         if self.action == "create":
-            return [permissions.IsAuthenticated(), IsMentorOrAdmin()]
-        elif self.action in ["update", "partial_update", "destroy"]:
-            return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
-        return [permissions.IsAuthenticated()]
+            return _MENTOR_WRITE
+        elif self.action in _CHANGE_ACTIONS:
+            return _OWNER_WRITE
+        return _READ
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -0,0 +1,20 @@
+from apps.issues.filters import IssueOrderingFilter, IssueSearchFilter
+
+# Text search configuration the article search_vector trigger indexes with
+KB_SEARCH_CONFIG = "english"
+
+
+class KnowledgeBaseSearchFilter(IssueSearchFilter):
+    """
+    Full-text search over the GIN-indexed article search_vector on
+    PostgreSQL, falling back to icontains lookups elsewhere.
+    """
+
+    search_config = KB_SEARCH_CONFIG
+
+
+class KnowledgeBaseOrderingFilter(IssueOrderingFilter):
+    """
+    OrderingFilter that lists the best matching articles first when the
+    client searches without choosing an ordering.
+    """
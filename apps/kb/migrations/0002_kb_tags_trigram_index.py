@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+TAGS_INDEX_SQL = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX kb_tags_trgm ON kb_knowledgebasearticle USING gin (tags gin_trgm_ops);
+"""
+
+DROP_TAGS_INDEX_SQL = """
+DROP INDEX IF EXISTS kb_tags_trgm;
+"""
+
+
+def create_tags_index(apps, schema_editor):
+    # Trigram GIN index on tags (PostgreSQL only); 0007 replaces it with one
+    # on the UPPER(tags) expression that tags__icontains actually filters on
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(TAGS_INDEX_SQL)
+
+
+def drop_tags_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TAGS_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kb', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_tags_index, drop_tags_index),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-14 15:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0009_attachment_uploaded_indexes'),
+        ('kb', '0002_kb_tags_trigram_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='knowledgebasearticle',
+            index=models.Index(fields=['-created_at'], name='kb_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='knowledgebasearticle',
+            index=models.Index(fields=['related_issue', '-created_at'], name='kb_issue_created_idx'),
+        ),
+    ]
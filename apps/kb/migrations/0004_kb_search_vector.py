@@ -0,0 +1,58 @@
+# Generated by Django 5.2.5 on 2026-10-14 15:00
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_TRIGGER_SQL = """
+CREATE INDEX kb_fts_gin ON kb_knowledgebasearticle USING gin (search_vector);
+CREATE FUNCTION kb_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.content, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.tags, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER kb_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, content, tags ON kb_knowledgebasearticle
+    FOR EACH ROW EXECUTE FUNCTION kb_search_vector_refresh();
+UPDATE kb_knowledgebasearticle SET search_vector =
+    setweight(to_tsvector('pg_catalog.english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.english', coalesce(content, '')), 'B') ||
+    setweight(to_tsvector('pg_catalog.english', coalesce(tags, '')), 'C');
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS kb_search_vector_update ON kb_knowledgebasearticle;
+DROP FUNCTION IF EXISTS kb_search_vector_refresh();
+DROP INDEX IF EXISTS kb_fts_gin;
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    # GIN indexes and tsvector triggers only exist on PostgreSQL
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(SEARCH_TRIGGER_SQL)
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_SEARCH_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kb', '0003_kb_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='knowledgebasearticle',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def normalize_tags(apps, schema_editor):
+    # Strip stored tags once so reads only need to split them
+    KnowledgeBaseArticle = apps.get_model('kb', 'KnowledgeBaseArticle')
+    articles = KnowledgeBaseArticle.objects.exclude(tags='').only('id', 'tags')
+    for article in articles.iterator():
+        tags = ','.join(tag.strip() for tag in article.tags.split(',') if tag.strip())
+        if tags != article.tags:
+            KnowledgeBaseArticle.objects.filter(pk=article.pk).update(tags=tags)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kb', '0004_kb_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+# tags__icontains compiles to UPPER("tags"::text) LIKE UPPER(%s) on
+# PostgreSQL, which only an index on that same expression can serve
+TAGS_INDEX_SQL = """
+DROP INDEX IF EXISTS kb_tags_trgm;
+CREATE INDEX kb_tags_upper_trgm ON kb_knowledgebasearticle
+    USING gin ((UPPER(tags::text)) gin_trgm_ops);
+"""
+
+DROP_TAGS_INDEX_SQL = """
+DROP INDEX IF EXISTS kb_tags_upper_trgm;
+CREATE INDEX kb_tags_trgm ON kb_knowledgebasearticle USING gin (tags gin_trgm_ops);
+"""
+
+
+def create_tags_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(TAGS_INDEX_SQL)
+
+
+def drop_tags_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_TAGS_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kb', '0006_kb_created_id_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_tags_index, drop_tags_index),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
+from django.utils.functional import cached_property
 from apps.issues.models import Issue
 
 
@@ -24,8 +26,31 @@ class KnowledgeBaseArticle(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search document over title, content and tags. On PostgreSQL
+    # it is kept up to date by a trigger and GIN-indexed (see migration 0004).
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return self.title
 
+    @cached_property
+    def tags_list(self):
+        """The stored tags as a list (tags are normalized on save)"""
+        return self.tags.split(",") if self.tags else []
+
+    def save(self, *args, **kwargs):
+        from .utils import normalize_tags
+
+        # Store tags stripped so reads only need to split them
+        self.tags = normalize_tags(self.tags)
+        self.__dict__.pop("tags_list", None)
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="kb_created_id_idx"),
+            models.Index(
+                fields=["related_issue", "-created_at"], name="kb_issue_created_idx"
+            ),
+        ]
@@ -0,0 +1,8 @@
+from apps.issues.pagination import IssueCursorPagination
+
+
+class KnowledgeBaseCursorPagination(IssueCursorPagination):
+    """
+    Keyset pagination for the article list, newest first, with full-text
+    matches paged by rank like issue searches.
+    """
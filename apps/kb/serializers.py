@@ -1,15 +1,18 @@
 from rest_framework import serializers
+from django.db.models import Prefetch
 from .models import KnowledgeBaseArticle
+from apps.issues.models import Issue
 from apps.issues.serializers import IssueListSerializer
+from issue_tracker.serializers import UpdateFieldsMixin
 from apps.issues.serializers import UserBriefSerializer
 
 
-class KnowledgeBaseArticleSerializer(serializers.ModelSerializer):
+class KnowledgeBaseArticleSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """Serializer for knowledge base articles"""
 
     created_by_details = UserBriefSerializer(source="created_by", read_only=True)
     related_issue_details = IssueListSerializer(source="related_issue", read_only=True)
-    tags_list = serializers.SerializerMethodField()
+    tags_list = serializers.ListField(child=serializers.CharField(), read_only=True)
 
     class Meta:
         model = KnowledgeBaseArticle
@@ -33,13 +36,31 @@ class KnowledgeBaseArticleSerializer(serializers.ModelSerializer):
             "related_issue_details",
         ]
 
-    def get_tags_list(self, obj):
-        """Convert comma-separated tags to a list"""
-        if obj.tags:
-            return [tag.strip() for tag in obj.tags.split(",") if tag.strip()]
-        return []
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Join the author and load the related issues of every article in one
+        prefetch query, shaped the way IssueListSerializer reads them.
+        """
+        return queryset.select_related("created_by").prefetch_related(
+            Prefetch(
+                "related_issue",
+                queryset=IssueListSerializer.setup_eager_loading(Issue.objects.all()),
+            )
+        )
 
     def create(self, validated_data):
         """Set the created_by field to the current user"""
         validated_data["created_by"] = self.context["request"].user
         return super().create(validated_data)
+
+
+class KnowledgeBaseArticleListSerializer(KnowledgeBaseArticleSerializer):
+    """Serializer for article lists, which leave out the article content"""
+
+    class Meta(KnowledgeBaseArticleSerializer.Meta):
+        fields = [
+            field
+            for field in KnowledgeBaseArticleSerializer.Meta.fields
+            if field != "content"
+        ]
@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import KnowledgeBaseArticle
+from .utils import invalidate_kb_cache
+
+
+@receiver(post_save, sender=KnowledgeBaseArticle)
+@receiver(post_delete, sender=KnowledgeBaseArticle)
+def kb_article_changed(sender, **kwargs):
+    """Expire cached KB responses once the change is committed"""
+    transaction.on_commit(invalidate_kb_cache)
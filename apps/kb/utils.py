@@ -0,0 +1,38 @@
+import hashlib
+
+from apps.issues.utils import ISSUE_LIST_CACHE_VERSION_KEY
+from issue_tracker.cache import bump_version, current_version
+
+KB_CACHE_VERSION_KEY = "kb:version"
+
+
+def kb_cache_key(request, action):
+    """
+    Build the cache key for a knowledge base list or article response.
+
+    Articles are the same for every user, so the key covers the KB version,
+    the issue list version (articles embed their related issue) and the
+    full URL, but not the user.
+    """
+    kb_version = current_version(KB_CACHE_VERSION_KEY)
+    issue_version = current_version(ISSUE_LIST_CACHE_VERSION_KEY)
+    url = hashlib.blake2b(
+        request.build_absolute_uri().encode(), digest_size=8
+    ).hexdigest()
+    return f"kb:{kb_version}:{issue_version}:{action}:{url}"
+
+
+def invalidate_kb_cache():
+    """
+    Expire every cached knowledge base response by bumping the KB version.
+    """
+    bump_version(KB_CACHE_VERSION_KEY)
+
+
+def normalize_tags(tags):
+    """
+    Return a comma-separated tag string with surrounding whitespace and
+    blank entries removed, so "django, , signals " is stored as
+    "django,signals" and can be split without further cleanup.
+    """
+    return ",".join(tag.strip() for tag in tags.split(",") if tag.strip())
@@ -1,14 +1,26 @@
-from rest_framework import viewsets, permissions, filters
+from rest_framework import viewsets, permissions, status
+from rest_framework.response import Response
+from django.conf import settings
+from django.core.cache import cache
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Q
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
     OpenApiParameter,
     OpenApiResponse,
 )
+from issue_tracker.cache import etag_matches, make_etag
+from issue_tracker.schema import FORBIDDEN, INVALID_DATA, UNAUTHENTICATED
 
+from .filters import KnowledgeBaseOrderingFilter, KnowledgeBaseSearchFilter
 from .models import KnowledgeBaseArticle
-from .serializers import KnowledgeBaseArticleSerializer
+from .pagination import KnowledgeBaseCursorPagination
+from .serializers import (
+    KnowledgeBaseArticleListSerializer,
+    KnowledgeBaseArticleSerializer,
+)
+from .utils import kb_cache_key
 from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
 
 
@@ -37,10 +49,8 @@ from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
             ),
         ],
         responses={
-            200: KnowledgeBaseArticleSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            200: KnowledgeBaseArticleListSerializer(many=True),
+            401: UNAUTHENTICATED,
         },
     ),
     create=extend_schema(
@@ -48,13 +58,9 @@ from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
         description="Create a new knowledge base article. Only accessible to mentors and admins.",
         responses={
             201: KnowledgeBaseArticleSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
         },
     ),
     retrieve=extend_schema(
@@ -62,9 +68,7 @@ from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
         description="Retrieve a specific knowledge base article.",
         responses={
             200: KnowledgeBaseArticleSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             404: OpenApiResponse(description="Article not found."),
         },
     ),
@@ -73,10 +77,8 @@ from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
         description="Update a knowledge base article. Only accessible to the creator, mentors, and admins.",
         responses={
             200: KnowledgeBaseArticleSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this article."
             ),
@@ -88,10 +90,8 @@ from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
         description="Partially update a knowledge base article. Only accessible to the creator, mentors, and admins.",
         responses={
             200: KnowledgeBaseArticleSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this article."
             ),
@@ -103,9 +103,7 @@ from apps.users.permissions import IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
         description="Delete a knowledge base article. Only accessible to the creator, mentors, and admins.",
         responses={
             204: OpenApiResponse(description="Article deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to delete this article."
             ),
@@ -122,13 +120,14 @@ class KnowledgeBaseArticleViewSet(viewsets.ModelViewSet):
     serializer_class = KnowledgeBaseArticleSerializer
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
+        KnowledgeBaseSearchFilter,
+        KnowledgeBaseOrderingFilter,
     ]
     filterset_fields = ["related_issue"]
     search_fields = ["title", "content", "tags"]
     ordering_fields = ["created_at", "updated_at", "title"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = KnowledgeBaseCursorPagination
 
     def get_permissions(self):
         if self.action == "create":
@@ -137,19 +136,61 @@ class KnowledgeBaseArticleViewSet(viewsets.ModelViewSet):
             return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
         return [permissions.IsAuthenticated()]
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return KnowledgeBaseArticleListSerializer
+        return KnowledgeBaseArticleSerializer
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def cached_response(self, view, request, *args, **kwargs):
+        """
+        Serve a read from the cache for KB_CACHE_TIMEOUT seconds, with an
+        ETag derived from the cache key so unchanged content is a 304.
+
+        Any article change (see signals) or change to the issues articles
+        embed moves the key, which also changes the ETag.
+        """
+        timeout = settings.KB_CACHE_TIMEOUT
+        if not timeout:
+            return view(request, *args, **kwargs)
+
+        cache_key = kb_cache_key(request, self.action)
+        etag = make_etag(cache_key.encode())
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = view(request, *args, **kwargs).data
+            cache.set(cache_key, data, timeout)
+        return Response(data, headers={"ETag": etag})
+
     def get_queryset(self):
-        queryset = super().get_queryset()
+        # search_vector is never rendered, and lists leave out the content
+        if self.action == "list":
+            queryset = super().get_queryset().defer("content", "search_vector")
+        else:
+            queryset = super().get_queryset().defer("search_vector")
 
         # Filter by tags if provided
         tags = self.request.query_params.get("tags")
         if tags:
-            tag_list = [tag.strip() for tag in tags.split(",")]
-            # Construct a query to find articles containing any of the specified tags
-            from django.db.models import Q
+            # Skip blank entries, which would match every article, and repeats
+            tag_list = dict.fromkeys(tag.strip() for tag in tags.split(","))
+            tag_list.pop("", None)
 
+            # Construct a query to find articles containing any of the
+            # specified tags; on PostgreSQL each lookup can use the trigram
+            # index on UPPER(tags) that icontains compiles to (migration 0007)
             tag_query = Q()
             for tag in tag_list:
                 tag_query |= Q(tags__icontains=tag)
-            queryset = queryset.filter(tag_query)
+            if tag_query:
+                queryset = queryset.filter(tag_query)
 
-        return queryset
+        return KnowledgeBaseArticleSerializer.setup_eager_loading(queryset)
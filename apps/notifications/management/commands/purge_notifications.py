@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.notifications.models import Notification
+from apps.notifications.signals import notification_deletes_unsignalled
+from apps.notifications.utils import invalidate_notifications
+
+
+class Command(BaseCommand):
+    help = "Deletes read notifications older than the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_DAYS,
+            help="Delete read notifications created more than this many days ago",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Notifications deleted per statement",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        expired = Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+
+        # Delete in short batches so no statement holds its locks for long,
+        # each as one DELETE followed by one cache call for its recipients
+        deleted = 0
+        with notification_deletes_unsignalled():
+            while True:
+                batch = list(
+                    expired.order_by("pk").values_list("pk", "user_id")[
+                        : options["batch_size"]
+                    ]
+                )
+                if not batch:
+                    break
+                pks, user_ids = zip(*batch)
+                deleted += Notification.objects.filter(pk__in=pks).delete()[0]
+                invalidate_notifications(set(user_ids))
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} read notifications"))
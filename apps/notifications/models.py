@@ -41,6 +41,18 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="notification_user_created"
+            ),
+            models.Index(
+                fields=["user", "is_read", "-created_at"],
+                name="notification_user_read",
+            ),
+            models.Index(
+                fields=["user", "notification_type"], name="notification_user_type"
+            ),
+        ]
 
     def __str__(self):
         return f"Notification for {self.user.username}: {self.message[:30]}..."
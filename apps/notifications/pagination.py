@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class NotificationCursorPagination(CursorPagination):
+    """
+    Keyset pagination for a user's notifications, newest first.
+
+    Pages continue from the last notification seen instead of skipping
+    OFFSET rows, and stay stable while new notifications arrive.
+    """
+
+    ordering = ("-created_at", "-id")
@@ -1,16 +1,21 @@
 from rest_framework import serializers
+from drf_spectacular.utils import extend_schema_field
 from .models import Notification
-from apps.issues.serializers import IssueListSerializer, UserBriefSerializer
+from apps.issues.serializers import (
+    ISSUE_STATUS_LABELS,
+    IssueListSerializer,
+    UserBriefSerializer,
+)
+
+# Display labels by notification type, resolved once instead of per row
+NOTIFICATION_TYPE_LABELS = dict(Notification.NOTIFICATION_TYPES)
 
 
 class NotificationSerializer(serializers.ModelSerializer):
     """Serializer for Notification model"""
 
     issue_details = serializers.SerializerMethodField(read_only=True)
-    notification_type_display = serializers.CharField(
-        source="get_notification_type_display", read_only=True
-    )
-    time_since = serializers.SerializerMethodField(read_only=True)
+    notification_type_display = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Notification
@@ -24,7 +29,6 @@ class NotificationSerializer(serializers.ModelSerializer):
             "notification_type_display",
             "is_read",
             "created_at",
-            "time_since",
         ]
         read_only_fields = [
             "user",
@@ -34,23 +38,68 @@ class NotificationSerializer(serializers.ModelSerializer):
             "created_at",
             "issue_details",
             "notification_type_display",
-            "time_since",
         ]
 
     def get_issue_details(self, obj):
         """Return minimal issue details if issue exists"""
-        if obj.issue:
+        issue = obj.issue
+        if issue:
             return {
-                "id": obj.issue.id,
-                "title": obj.issue.title,
-                "status": obj.issue.status,
-                "status_display": obj.issue.get_status_display(),
+                "id": issue.id,
+                "title": issue.title,
+                "status": issue.status,
+                "status_display": ISSUE_STATUS_LABELS.get(issue.status, issue.status),
             }
         return None
 
-    def get_time_since(self, obj):
-        """Return human-readable time since notification creation"""
-        from django.utils import timezone
-        from django.utils.timesince import timesince
+    @extend_schema_field(serializers.CharField())
+    def get_notification_type_display(self, obj):
+        """Return the display label for the notification type"""
+        return NOTIFICATION_TYPE_LABELS.get(
+            obj.notification_type, obj.notification_type
+        )
 
-        return timesince(obj.created_at, timezone.now())
+    # Columns read by values_representation(), one joined row per notification
+    values_fields = (
+        "id",
+        "user",
+        "issue",
+        "issue__title",
+        "issue__status",
+        "message",
+        "notification_type",
+        "is_read",
+        "created_at",
+    )
+
+    @classmethod
+    def values_representation(cls, row):
+        """
+        Build the same representation as to_representation() from a row of
+        queryset.values(*values_fields), without model instances or fields.
+        """
+        issue_details = None
+        if row["issue"] is not None:
+            status = row["issue__status"]
+            issue_details = {
+                "id": row["issue"],
+                "title": row["issue__title"],
+                "status": status,
+                "status_display": ISSUE_STATUS_LABELS.get(status, status),
+            }
+        notification_type = row["notification_type"]
+        return {
+            "id": row["id"],
+            "user": row["user"],
+            "issue": row["issue"],
+            "issue_details": issue_details,
+            "message": row["message"],
+            "notification_type": notification_type,
+            "notification_type_display": NOTIFICATION_TYPE_LABELS.get(
+                notification_type, notification_type
+            ),
+            "is_read": row["is_read"],
+            "created_at": serializers.DateTimeField().to_representation(
+                row["created_at"]
+            ),
+        }
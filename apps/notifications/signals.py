@@ -1,162 +1,306 @@
-from django.db.models.signals import post_save, pre_save
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext as _
 
 from apps.issues.models import Issue, Comment, IssueFeedback
 from .models import Notification
+from .utils import invalidate_notifications
 
 User = get_user_model()
 
+# Rows per INSERT when fanning a notification out to many users
+NOTIFICATION_BATCH_SIZE = 500
+
+# Set while suppress_notifications() is active in the current thread/task
+_suppressed = ContextVar("notifications_suppressed", default=False)
+
+
+@contextmanager
+def suppress_notifications():
+    """
+    Skip the notification handlers for saves made inside the block.
+
+    Meant for bulk imports and data fixes: the receivers stay connected
+    (so other threads are unaffected) and return early instead. Run
+    notify_new_issues() over the imported issues afterwards to fan their
+    creation out in one insert.
+    """
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def build_notifications(user_ids, issue, notification_type, message):
+    """Build (unsaved) copies of one notification for each user id"""
+    return [
+        Notification(
+            user_id=user_id,
+            issue=issue,
+            notification_type=notification_type,
+            message=message,
+        )
+        for user_id in user_ids
+    ]
+
+
+def save_notifications(notifications):
+    """
+    Insert notifications in batches and, once committed, expire their
+    recipients' cached notification responses (bulk_create() sends no
+    signals).
+    """
+    Notification.objects.bulk_create(notifications, batch_size=NOTIFICATION_BATCH_SIZE)
+    user_ids = {notification.user_id for notification in notifications}
+    transaction.on_commit(lambda: invalidate_notifications(user_ids))
+
 
-def create_notification(user, issue, notification_type, message):
-    """Helper function to create a notification"""
-    Notification.objects.create(
-        user=user, issue=issue, notification_type=notification_type, message=message
+def notify_users(users, issue, notification_type, message):
+    """
+    Create the same notification for every user in a queryset at once,
+    after the current transaction commits.
+
+    Fan-outs are the slow part of these handlers, so running them on
+    commit keeps them out of the transaction that saved the issue, and a
+    rolled-back save notifies nobody.
+    """
+    transaction.on_commit(
+        lambda: save_notifications(
+            build_notifications(
+                users.values_list("pk", flat=True), issue, notification_type, message
+            )
+        )
     )
 
 
+def cohort_staff(cohort):
+    """Mentors of the cohort plus all admins"""
+    return User.objects.filter(Q(role=User.MENTOR, cohort=cohort) | Q(role=User.ADMIN))
+
+
+def notify_new_issues(issues):
+    """
+    Notify each issue's cohort mentors and all admins of its creation, with
+    one staff query and one insert for the whole batch.
+    """
+    issues = list(issues)
+    staff = User.objects.filter(
+        Q(role=User.MENTOR, cohort__in={issue.cohort for issue in issues})
+        | Q(role=User.ADMIN)
+    ).values_list("pk", "role", "cohort")
+
+    admin_ids = []
+    mentor_ids = defaultdict(list)
+    for pk, role, cohort in staff:
+        if role == User.ADMIN:
+            admin_ids.append(pk)
+        else:
+            mentor_ids[cohort].append(pk)
+
+    notifications = []
+    for issue in issues:
+        notifications += build_notifications(
+            [*mentor_ids[issue.cohort], *admin_ids],
+            issue,
+            Notification.ISSUE_CREATED,
+            _("New issue reported: %(title)s") % {"title": issue.title},
+        )
+    save_notifications(notifications)
+
+
 @receiver(post_save, sender=Issue)
 def issue_notification(sender, instance, created, **kwargs):
-    """Create notifications when an issue is created or updated"""
+    """Create notifications when an issue is created, updated or assigned"""
+    if _suppressed.get():
+        return
+
     if created:
-        # Notify all mentors in the cohort about the new issue
-        mentors = User.objects.filter(role=User.MENTOR, cohort=instance.cohort)
-        for mentor in mentors:
-            create_notification(
-                user=mentor,
-                issue=instance,
-                notification_type=Notification.ISSUE_CREATED,
-                message=_(f"New issue reported: {instance.title}"),
-            )
+        # Notify all mentors in the cohort and any admins about the new issue
+        notify_users(
+            cohort_staff(instance.cohort),
+            issue=instance,
+            notification_type=Notification.ISSUE_CREATED,
+            message=_("New issue reported: %(title)s") % {"title": instance.title},
+        )
+        return
 
-        # Also notify any admins
-        admins = User.objects.filter(role=User.ADMIN)
-        for admin in admins:
-            create_notification(
-                user=admin,
-                issue=instance,
-                notification_type=Notification.ISSUE_CREATED,
-                message=_(f"New issue reported: {instance.title}"),
+    # Recipients of this save in priority order, each notified once
+    recipients = []
+    if getattr(instance, "_newly_assigned", False):
+        # Notify the assignee
+        recipients.append(
+            (
+                [instance.assigned_to_id],
+                Notification.ISSUE_ASSIGNED,
+                _("You have been assigned to: %(title)s") % {"title": instance.title},
             )
-    else:
-        # Check if status has changed
-        if hasattr(instance, "_status_changed") and instance._status_changed:
-            # Notify the reporter
-            if instance.reported_by:
-                create_notification(
-                    user=instance.reported_by,
-                    issue=instance,
-                    notification_type=Notification.ISSUE_UPDATED,
-                    message=_(
-                        f"Issue status changed to: {instance.get_status_display()}"
-                    ),
+        )
+    if getattr(instance, "_status_changed", False):
+        # Notify the reporter
+        if instance.reported_by_id:
+            recipients.append(
+                (
+                    [instance.reported_by_id],
+                    Notification.ISSUE_UPDATED,
+                    _("Issue status changed to: %(status)s")
+                    % {"status": instance.get_status_display()},
                 )
+            )
 
-            # If resolved, notify mentors and admins
-            if instance.status == Issue.RESOLVED:
-                # Notify mentors in the cohort
-                mentors = User.objects.filter(role=User.MENTOR, cohort=instance.cohort)
-                for mentor in mentors:
-                    create_notification(
-                        user=mentor,
-                        issue=instance,
-                        notification_type=Notification.ISSUE_RESOLVED,
-                        message=_(f"Issue resolved: {instance.title}"),
-                    )
-
-                # Notify admins
-                admins = User.objects.filter(role=User.ADMIN)
-                for admin in admins:
-                    create_notification(
-                        user=admin,
-                        issue=instance,
-                        notification_type=Notification.ISSUE_RESOLVED,
-                        message=_(f"Issue resolved: {instance.title}"),
-                    )
+        # If resolved, notify mentors and admins
+        if instance.status == Issue.RESOLVED:
+            recipients.append(
+                (
+                    cohort_staff(instance.cohort).values_list("pk", flat=True),
+                    Notification.ISSUE_RESOLVED,
+                    _("Issue resolved: %(title)s") % {"title": instance.title},
+                )
+            )
+
+    if not recipients:
+        return
+
+    def notify_recipients():
+        notified = set()
+        notifications = []
+        for user_ids, notification_type, message in recipients:
+            user_ids = [pk for pk in user_ids if pk not in notified]
+            notified.update(user_ids)
+            notifications += build_notifications(
+                user_ids, instance, notification_type, message
+            )
+
+        # One INSERT for every recipient of the save
+        save_notifications(notifications)
+
+    # Like notify_users(), fan out once the save has committed
+    transaction.on_commit(notify_recipients)
 
 
 @receiver(pre_save, sender=Issue)
-def track_issue_changes(sender, instance, **kwargs):
+def track_issue_changes(sender, instance, update_fields=None, **kwargs):
     """Track changes to issue status"""
+    instance._newly_assigned = False
+
+    # Nothing to track while suppressed, and saves limited to other columns
+    # leave the status and assignee alone
+    if _suppressed.get() or (
+        update_fields is not None and Issue.STATE_FIELDS.isdisjoint(update_fields)
+    ):
+        instance._status_changed = False
+        return
+
     if instance.pk:
-        try:
-            old_instance = Issue.objects.get(pk=instance.pk)
-            if old_instance.status != instance.status:
-                instance._status_changed = True
-
-                # Track assignment changes
-                if (
-                    old_instance.assigned_to != instance.assigned_to
-                    and instance.assigned_to
-                ):
-                    instance._newly_assigned = True
-            else:
-                instance._status_changed = False
-        except Issue.DoesNotExist:
-            pass
+        # Issue.save() has already read the stored values
+        stored_state = getattr(instance, "_stored_state", None)
+        if stored_state is None:
+            stored_state = (
+                Issue.objects.filter(pk=instance.pk)
+                .values_list("status", "assigned_to_id")
+                .first()
+            )
+        if stored_state is None:
+            return
 
+        old_status, old_assigned_to_id = stored_state
+        if old_status != instance.status:
+            instance._status_changed = True
 
-@receiver(post_save, sender=Issue)
-def issue_assignment_notification(sender, instance, **kwargs):
-    """Create notifications when an issue is assigned"""
-    if hasattr(instance, "_newly_assigned") and instance._newly_assigned:
-        # Notify the assignee
-        create_notification(
-            user=instance.assigned_to,
-            issue=instance,
-            notification_type=Notification.ISSUE_ASSIGNED,
-            message=_(f"You have been assigned to: {instance.title}"),
-        )
+            # Track assignment changes
+            if (
+                old_assigned_to_id != instance.assigned_to_id
+                and instance.assigned_to_id
+            ):
+                instance._newly_assigned = True
+        else:
+            instance._status_changed = False
 
 
 @receiver(post_save, sender=Comment)
 def comment_notification(sender, instance, created, **kwargs):
     """Create notifications when a comment is added"""
-    if created:
+    if created and not _suppressed.get():
+        # Compare ids so neither the reporter nor the assignee is loaded
+        issue = instance.issue
+        notifications = []
+
         # Notify the issue reporter
-        if instance.issue.reported_by and instance.issue.reported_by != instance.user:
-            create_notification(
-                user=instance.issue.reported_by,
-                issue=instance.issue,
+        if issue.reported_by_id and issue.reported_by_id != instance.user_id:
+            notifications += build_notifications(
+                [issue.reported_by_id],
+                issue=issue,
                 notification_type=Notification.COMMENT_ADDED,
-                message=_(f"New comment on your issue: {instance.issue.title}"),
+                message=_("New comment on your issue: %(title)s")
+                % {"title": issue.title},
             )
 
         # Notify the assignee if different from commenter and reporter
-        if (
-            instance.issue.assigned_to
-            and instance.issue.assigned_to != instance.user
-            and instance.issue.assigned_to != instance.issue.reported_by
+        if issue.assigned_to_id and issue.assigned_to_id not in (
+            instance.user_id,
+            issue.reported_by_id,
         ):
-            create_notification(
-                user=instance.issue.assigned_to,
-                issue=instance.issue,
+            notifications += build_notifications(
+                [issue.assigned_to_id],
+                issue=issue,
                 notification_type=Notification.COMMENT_ADDED,
-                message=_(f"New comment on issue: {instance.issue.title}"),
+                message=_("New comment on issue: %(title)s") % {"title": issue.title},
             )
 
+        if notifications:
+            save_notifications(notifications)
+
 
 @receiver(post_save, sender=IssueFeedback)
 def feedback_notification(sender, instance, created, **kwargs):
     """Create notifications when feedback is added"""
-    if created:
-        # Notify the assignee
-        if instance.issue.assigned_to:
-            create_notification(
-                user=instance.issue.assigned_to,
-                issue=instance.issue,
-                notification_type=Notification.FEEDBACK_ADDED,
-                message=_(f"Feedback received on issue: {instance.issue.title}"),
-            )
+    if created and not _suppressed.get():
+        issue = instance.issue
+        message = _("Feedback received on issue: %(title)s") % {"title": issue.title}
+        mentors = User.objects.filter(role=User.MENTOR, cohort=issue.cohort)
 
-        # Notify mentors in the cohort
-        mentors = User.objects.filter(role=User.MENTOR, cohort=instance.issue.cohort)
-        for mentor in mentors:
-            if mentor != instance.issue.assigned_to:  # Avoid duplicate for assignee
-                create_notification(
-                    user=mentor,
-                    issue=instance.issue,
-                    notification_type=Notification.FEEDBACK_ADDED,
-                    message=_(f"Feedback received on issue: {instance.issue.title}"),
+        def notify_feedback():
+            # Notify the assignee and the cohort's mentors, each once, in
+            # one INSERT
+            user_ids = set(mentors.values_list("pk", flat=True))
+            if issue.assigned_to_id:
+                user_ids.add(issue.assigned_to_id)
+            save_notifications(
+                build_notifications(
+                    user_ids, issue, Notification.FEEDBACK_ADDED, message
                 )
+            )
+
+        # Like notify_users(), fan out once the save has committed
+        transaction.on_commit(notify_feedback)
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def notification_changed(sender, instance, **kwargs):
+    """Expire the recipient's cached notification responses"""
+    transaction.on_commit(lambda: invalidate_notifications([instance.user_id]))
+
+
+@contextmanager
+def notification_deletes_unsignalled():
+    """
+    Disconnect notification_changed from post_delete inside the block.
+
+    With no delete receivers left, QuerySet.delete() on notifications is a
+    single DELETE instead of loading every row and signalling each one, so
+    the caller must expire the recipients' caches itself. The receiver is
+    disconnected process-wide: meant for management commands, not requests.
+    """
+    post_delete.disconnect(notification_changed, sender=Notification)
+    try:
+        yield
+    finally:
+        post_delete.connect(notification_changed, sender=Notification)
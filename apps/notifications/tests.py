@@ -1,3 +1,101 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from apps.issues.models import Course, Project, Issue
+from apps.users.models import User
+from .models import Notification
+
+
+@override_settings(NOTIFICATION_CACHE_TIMEOUT=0)
+class NotificationListFastPathTests(TestCase):
+    """The .values() fast path must render exactly what the serializer does"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.mentor = User.objects.create_user(
+            "mentor", "mentor@example.com", "Pass12345!x", role=User.MENTOR, cohort="C1"
+        )
+        student = User.objects.create_user(
+            "student", "student@example.com", "Pass12345!x", role=User.STUDENT
+        )
+        course = Course.objects.create(name="Backend", duration_in_weeks=12)
+        project = Project.objects.create(
+            name="Django", course=course, week_number=1, total_tasks=2
+        )
+        issue = Issue.objects.create(
+            title="Checker fails",
+            description="The checker rejects a correct answer",
+            category=Issue.CHECKER_ERROR,
+            reported_by=student,
+            course=course,
+            project=project,
+            cohort="C1",
+            week_number=1,
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    user=cls.mentor,
+                    issue=issue,
+                    notification_type=Notification.ISSUE_CREATED,
+                    message="New issue reported: Checker fails",
+                ),
+                Notification(
+                    user=cls.mentor,
+                    issue=issue,
+                    notification_type=Notification.COMMENT_ADDED,
+                    message="New comment on issue: Checker fails",
+                    is_read=True,
+                ),
+            ]
+        )
+
+    def assert_same_json(self, url):
+        client = APIClient()
+        client.force_authenticate(self.mentor)
+        fast = client.get(url)
+        with override_settings(NOTIFICATION_LIST_VALUES_FAST_PATH=False):
+            slow = client.get(url)
+        self.assertEqual(fast.status_code, 200)
+        self.assertTrue(fast.json()["results"])
+        self.assertEqual(fast.json(), slow.json())
+
+    def test_notification_list(self):
+        self.assert_same_json("/api/notifications/")
+
+    def test_filtered_notification_list(self):
+        self.assert_same_json("/api/notifications/?is_read=false")
+
+
+@override_settings(NOTIFICATION_CACHE_TIMEOUT=300)
+class NotificationETagTests(TestCase):
+    """Cached notification reads answer If-None-Match as RFC 9110 lists"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            "student", "student@example.com", "Pass12345!x", role=User.STUDENT
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_unread_count(self, if_none_match=None):
+        headers = {"HTTP_IF_NONE_MATCH": if_none_match} if if_none_match else {}
+        return self.client.get("/api/notifications/unread_count/", **headers)
+
+    def test_if_none_match(self):
+        etag = self.get_unread_count()["ETag"]
+        for header, status in [
+            (etag, 304),
+            (f'"other", {etag}', 304),
+            (f"W/{etag}", 304),
+            ("*", 304),
+            ('"other"', 200),
+            (etag[:-2] + '"', 200),
+        ]:
+            with self.subTest(header=header):
+                self.assertEqual(self.get_unread_count(header).status_code, status)
@@ -0,0 +1,39 @@
+import hashlib
+
+from apps.issues.utils import ISSUE_LIST_CACHE_VERSION_KEY
+from issue_tracker.cache import bump_versions, current_version
+
+
+def notification_version_key(user_id):
+    return f"notifications:{user_id}:version"
+
+
+def notification_cache_key(request, action):
+    """
+    Build the cache key for a user's notification list or unread count.
+
+    The key covers the user's notification version, the action and, for
+    lists, the issue list version (notifications embed their issue's title
+    and status) and the full URL (query string filters and pagination
+    links). The unread count depends on neither, so issue changes and
+    query strings never split or expire it.
+    """
+    user_version = current_version(notification_version_key(request.user.pk))
+    key = f"notifications:{request.user.pk}:{user_version}:{action}"
+    if action == "unread_count":
+        return key
+
+    issue_version = current_version(ISSUE_LIST_CACHE_VERSION_KEY)
+    url = hashlib.blake2b(
+        request.build_absolute_uri().encode(), digest_size=8
+    ).hexdigest()
+    return f"{key}:{issue_version}:{url}"
+
+
+def invalidate_notifications(user_ids):
+    """
+    Expire the cached notification responses of the given users.
+
+    One round trip for any number of users.
+    """
+    bump_versions([notification_version_key(user_id) for user_id in user_ids])
@@ -1,6 +1,8 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.conf import settings
+from django.core.cache import cache
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import (
     extend_schema,
@@ -8,9 +10,26 @@ from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiResponse,
 )
+from issue_tracker.cache import etag_matches, make_etag
+from issue_tracker.schema import UNAUTHENTICATED
 
 from .models import Notification
+from .pagination import NotificationCursorPagination
 from .serializers import NotificationSerializer
+from .utils import invalidate_notifications, notification_cache_key
+
+# Columns NotificationSerializer renders, including the joined issue's
+NOTIFICATION_COLUMNS = (
+    "id",
+    "user",
+    "issue__id",
+    "issue__title",
+    "issue__status",
+    "message",
+    "notification_type",
+    "is_read",
+    "created_at",
+)
 
 
 @extend_schema_view(
@@ -19,9 +38,7 @@ from .serializers import NotificationSerializer
         description="List notifications for the current user.",
         responses={
             200: NotificationSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     ),
     retrieve=extend_schema(
@@ -29,9 +46,7 @@ from .serializers import NotificationSerializer
         description="Retrieve a specific notification.",
         responses={
             200: NotificationSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to access this notification."
             ),
@@ -49,20 +64,70 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["is_read", "notification_type"]
     ordering_fields = ["created_at"]
-    ordering = ["-created_at"]
+    ordering = ["-created_at", "-id"]
+    pagination_class = NotificationCursorPagination
 
     def get_queryset(self):
         """Return notifications for the current user only"""
-        return Notification.objects.filter(user=self.request.user)
+        # Join the issue summarised in issue_details, reading only its
+        # rendered columns
+        return (
+            Notification.objects.filter(user=self.request.user)
+            .select_related("issue")
+            .only(*NOTIFICATION_COLUMNS)
+        )
+
+    def cached_response(self, view, request, *args, **kwargs):
+        """
+        Serve a read from the cache for NOTIFICATION_CACHE_TIMEOUT seconds,
+        with an ETag derived from the cache key so polling clients get a
+        304 until one of their notifications (or a rendered issue) changes.
+        """
+        timeout = settings.NOTIFICATION_CACHE_TIMEOUT
+        if not timeout:
+            return view(request, *args, **kwargs)
+
+        cache_key = notification_cache_key(request, self.action)
+        etag = make_etag(cache_key.encode())
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = view(request, *args, **kwargs).data
+            cache.set(cache_key, data, timeout)
+        return Response(data, headers={"ETag": etag})
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(self.list_response, request, *args, **kwargs)
+
+    def list_response(self, request, *args, **kwargs):
+        """
+        With NOTIFICATION_LIST_VALUES_FAST_PATH enabled, rows are read with
+        .values() and rendered without building model instances or
+        serializer fields.
+        """
+        if not settings.NOTIFICATION_LIST_VALUES_FAST_PATH:
+            return super().list(request, *args, **kwargs)
+
+        rows = self.filter_queryset(self.get_queryset()).values(
+            *NotificationSerializer.values_fields
+        )
+        page = self.paginate_queryset(rows)
+        data = [
+            NotificationSerializer.values_representation(row)
+            for row in (rows if page is None else page)
+        ]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
 
     @extend_schema(
         summary="Mark notification as read",
         description="Mark a specific notification as read.",
         responses={
             200: NotificationSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
             403: OpenApiResponse(
                 description="You do not have permission to update this notification."
             ),
@@ -73,8 +138,11 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     def mark_read(self, request, pk=None):
         """Mark a notification as read"""
         notification = self.get_object()
-        notification.is_read = True
-        notification.save()
+        if not notification.is_read:
+            # A single-column UPDATE, skipping save() and its signals
+            Notification.objects.filter(pk=notification.pk).update(is_read=True)
+            notification.is_read = True
+            invalidate_notifications([request.user.pk])
         serializer = self.get_serializer(notification)
         return Response(serializer.data)
 
@@ -83,15 +151,14 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         description="Mark all notifications for the current user as read.",
         responses={
             200: OpenApiResponse(description="All notifications marked as read."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     )
     @action(detail=False, methods=["post"])
     def mark_all_read(self, request):
         """Mark all notifications as read"""
-        self.get_queryset().update(is_read=True)
+        if self.get_queryset().filter(is_read=False).update(is_read=True):
+            invalidate_notifications([request.user.pk])
         return Response({"detail": "All notifications marked as read."})
 
     @extend_schema(
@@ -99,13 +166,14 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         description="Get the count of unread notifications for the current user.",
         responses={
             200: OpenApiResponse(description="Count of unread notifications."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     )
     @action(detail=False, methods=["get"])
     def unread_count(self, request):
         """Get count of unread notifications"""
+        return self.cached_response(self.unread_count_response, request)
+
+    def unread_count_response(self, request):
         count = self.get_queryset().filter(is_read=False).count()
         return Response({"unread_count": count})
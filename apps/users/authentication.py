@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from issue_tracker.cache import bump_version, current_version
+
+# Most tokens validated per process before the memo is emptied
+VALIDATED_TOKEN_CACHE_SIZE = 10_000
+
+# Columns kept in the cached copy of an authenticated user: those the
+# permission checks and queryset scopes read. The rest, password hash
+# included, is never cached and loads from the database if accessed. Listed
+# in model field order, the order from_db() assigns values in.
+USER_AUTH_CACHE_FIELDS = ("id", "is_active", "role", "cohort")
+
+
+def user_version_key(user_id):
+    return f"users:{user_id}:version"
+
+
+def user_cache_key(user_id):
+    version = current_version(user_version_key(user_id))
+    return f"users:{user_id}:{version}:auth"
+
+
+def user_detail_cache_key(user_id):
+    version = current_version(user_version_key(user_id))
+    return f"users:{user_id}:{version}:me"
+
+
+def invalidate_user_cache(user_id):
+    """
+    Expire the user's cached authentication copy and /users/me/ payload by
+    bumping their version, so a request that read the user before the change
+    can only store them under the old key.
+    """
+    bump_version(user_version_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that remembers validated access tokens in process for
+    JWT_VALIDATION_CACHE_SECONDS (never past their expiry), so a client
+    sending the same token on every request has its signature checked and
+    payload decoded once per window instead of on each request.
+    """
+
+    _validated = {}
+    _lock = threading.Lock()
+
+    def get_validated_token(self, raw_token):
+        ttl = settings.JWT_VALIDATION_CACHE_SECONDS
+        if not ttl:
+            return super().get_validated_token(raw_token)
+
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        now = time.time()
+        cached = self._validated.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        token = super().get_validated_token(raw_token)
+        with self._lock:
+            if len(self._validated) >= VALIDATED_TOKEN_CACHE_SIZE:
+                self._validated.clear()
+            self._validated[key] = (min(now + ttl, token["exp"]), token)
+        return token
+
+    def get_user(self, validated_token):
+        """
+        Load the token's user from the cache for USER_AUTH_CACHE_TIMEOUT
+        seconds instead of querying it on every request. Only the
+        USER_AUTH_CACHE_FIELDS columns are cached; the user comes back with
+        the others deferred. Saving or deleting the user moves the key
+        (see signals), and inactive users are never cached since the parent
+        rejects them.
+        """
+        timeout = settings.USER_AUTH_CACHE_TIMEOUT
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        # Revocation checks compare the password hash, which isn't cached
+        if not timeout or user_id is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        values = cache.get(key)
+        if values is None:
+            user = super().get_user(validated_token)
+            cache.set(
+                key, [getattr(user, field) for field in USER_AUTH_CACHE_FIELDS], timeout
+            )
+            return user
+
+        user = self.user_model.from_db(
+            router.db_for_read(self.user_model), USER_AUTH_CACHE_FIELDS, values
+        )
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Document CachedJWTAuthentication as the same bearer scheme"""
+
+    target_class = CachedJWTAuthentication
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with costs taken from settings (ARGON2_TIME_COST,
+    ARGON2_MEMORY_COST in KiB, ARGON2_PARALLELISM) instead of Django's
+    fixed defaults, so they can be sized to the servers.
+
+    Hashes made with other costs still verify and are rehashed with these
+    on the user's next login.
+    """
+
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
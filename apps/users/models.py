@@ -22,6 +22,14 @@ class User(AbstractUser):
     )
     cohort = models.CharField(max_length=50, blank=True, null=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Notification fan-out looks up a cohort's mentors and all admins
+            models.Index(fields=["role", "cohort"], name="user_role_cohort_idx"),
+            # The user list pages by join date (see UserCursorPagination)
+            models.Index(fields=["-date_joined", "-id"], name="user_joined_id_idx"),
+        ]
+
     def is_student(self):
         return self.role == self.STUDENT
 
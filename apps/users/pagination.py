@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the user list, newest accounts first.
+
+    Pages continue from the last user seen instead of counting the table
+    and skipping OFFSET rows, so every page costs one indexed query.
+    """
+
+    ordering = ("-date_joined", "-id")
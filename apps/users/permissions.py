@@ -1,4 +1,10 @@
 from rest_framework import permissions
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+# Roles with staff access, checked with one lookup of the user's role
+STAFF_ROLES = frozenset({User.MENTOR, User.ADMIN})
 
 
 class IsStudent(permissions.BasePermission):
@@ -45,7 +51,7 @@ class IsMentorOrAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        return request.user.is_mentor() or request.user.is_admin()
+        return request.user.role in STAFF_ROLES
 
     def __str__(self):
         return "Mentor or admin access only"
@@ -57,12 +63,13 @@ class IsOwnerOrMentorOrAdmin(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        if request.user.is_mentor() or request.user.is_admin():
+        if request.user.role in STAFF_ROLES:
             return True
 
         # Assuming the object has a 'reported_by' field for user ownership
+        # Compares ids so the reporter's user row isn't loaded
         if hasattr(obj, "reported_by"):
-            return obj.reported_by == request.user
+            return obj.reported_by_id == request.user.pk
 
         # If the object is a user, check if it's the same user
         if hasattr(obj, "id"):
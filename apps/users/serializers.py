@@ -5,15 +5,28 @@ from django.core.exceptions import ValidationError
 from drf_spectacular.utils import extend_schema_field, inline_serializer
 from drf_spectacular.types import OpenApiTypes
 
+from issue_tracker.serializers import UpdateFieldsMixin
+
 User = get_user_model()
 
+# Display labels by role, resolved once instead of per row
+USER_ROLE_LABELS = dict(User.ROLE_CHOICES)
+
+
+class RoleDisplayMixin:
+    """Render role_display from USER_ROLE_LABELS"""
+
+    @extend_schema_field(serializers.CharField())
+    def get_role_display(self, obj):
+        return USER_ROLE_LABELS.get(obj.role, obj.role)
 
-class UserSerializer(serializers.ModelSerializer):
+
+class UserSerializer(RoleDisplayMixin, serializers.ModelSerializer):
     """
     Serializer for the User model with limited fields for general use.
     """
 
-    role_display = serializers.CharField(source="get_role_display", read_only=True)
+    role_display = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = User
@@ -30,13 +43,33 @@ class UserSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "date_joined", "role_display"]
 
+    @classmethod
+    def user_representation(cls, user):
+        """
+        Build the same representation as to_representation() straight from
+        the user's attributes, without binding serializer fields.
+        """
+        return {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "role": user.role,
+            "role_display": USER_ROLE_LABELS.get(user.role, user.role),
+            "cohort": user.cohort,
+            "date_joined": serializers.DateTimeField().to_representation(
+                user.date_joined
+            ),
+        }
+
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(RoleDisplayMixin, serializers.ModelSerializer):
     """
     Detailed serializer for the User model with all relevant fields.
     """
 
-    role_display = serializers.CharField(source="get_role_display", read_only=True)
+    role_display = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = User
@@ -55,6 +88,23 @@ class UserDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "date_joined", "role_display", "last_login"]
 
+    @classmethod
+    def user_representation(cls, user):
+        """
+        Build the same representation as to_representation() straight from
+        the user's attributes, without binding serializer fields.
+        """
+        last_login = user.last_login
+        return {
+            **UserSerializer.user_representation(user),
+            "is_active": user.is_active,
+            "last_login": (
+                serializers.DateTimeField().to_representation(last_login)
+                if last_login
+                else None
+            ),
+        }
+
 
 class UserCreateSerializer(serializers.ModelSerializer):
     """
@@ -123,7 +173,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating user information.
     """
@@ -1,8 +1,11 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 import logging
 
+from .authentication import invalidate_user_cache
+
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
@@ -16,3 +19,13 @@ def log_user_creation(sender, instance, created, **kwargs):
         logger.info(
             f"New user created: {instance.username} (Role: {instance.role}, Cohort: {instance.cohort})"
         )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    """
+    Expire the user's cached authentication copy and /users/me/ payload once
+    the change commits
+    """
+    transaction.on_commit(lambda: invalidate_user_cache(instance.pk))
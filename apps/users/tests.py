@@ -1,3 +1,109 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from .authentication import (
+    CachedJWTAuthentication,
+    USER_AUTH_CACHE_FIELDS,
+    user_cache_key,
+)
+from .models import User
+
+
+@override_settings(USER_AUTH_CACHE_TIMEOUT=30)
+class CachedJWTAuthenticationTests(TestCase):
+    """Token users come from the cache until a save moves their key"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.mentor = User.objects.create_user(
+            "mentor", "mentor@example.com", "Pass12345!x", role=User.MENTOR, cohort="C1"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def client_for(self, user):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client
+
+    def save(self, user):
+        # The key moves once the change commits
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+
+    def test_cache_hit_loads_only_auth_fields(self):
+        authentication = CachedJWTAuthentication()
+        token = AccessToken.for_user(self.mentor)
+        authentication.get_user(token)
+        self.assertNotIn(
+            self.mentor.password, cache.get(user_cache_key(self.mentor.pk))
+        )
+
+        with self.assertNumQueries(0):
+            user = authentication.get_user(token)
+        self.assertEqual(user, self.mentor)
+        self.assertEqual(
+            user.get_deferred_fields(),
+            {
+                field.attname
+                for field in User._meta.concrete_fields
+                if field.attname not in USER_AUTH_CACHE_FIELDS
+            },
+        )
+        for field in USER_AUTH_CACHE_FIELDS:
+            self.assertEqual(getattr(user, field), getattr(self.mentor, field))
+
+    def test_deactivated_user_rejected_on_next_request(self):
+        client = self.client_for(self.mentor)
+        self.assertEqual(client.get("/api/users/me/").status_code, 200)
+
+        self.mentor.is_active = False
+        self.save(self.mentor)
+        self.assertEqual(client.get("/api/users/me/").status_code, 401)
+
+    def test_demoted_user_rejected_on_next_request(self):
+        client = self.client_for(self.mentor)
+        self.assertEqual(client.get("/api/users/").status_code, 200)
+
+        self.mentor.role = User.STUDENT
+        self.save(self.mentor)
+        self.assertEqual(client.get("/api/users/").status_code, 403)
+
+
+@override_settings(USER_AUTH_CACHE_TIMEOUT=30, USER_DETAIL_CACHE_TIMEOUT=300)
+class MeCacheTests(TestCase):
+    """/users/me/ is served from the cache until a save moves its key"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(
+            "student", "student@example.com", "Pass12345!x", cohort="C1"
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.student)}"
+        )
+
+    def test_repeat_request_runs_no_queries(self):
+        first = self.client.get("/api/users/me/")
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/users/me/")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_saved_user_shows_on_next_request(self):
+        first = self.client.get("/api/users/me/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.first_name = "Ada"
+            self.student.save()
+
+        response = self.client.get("/api/users/me/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["first_name"], "Ada")
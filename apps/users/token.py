@@ -24,9 +24,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
 
-        # Add user information to the response
-        user_serializer = UserSerializer(self.user)
-        data["user"] = user_serializer.data
+        # Add user information to the response, as UserSerializer renders it
+        data["user"] = UserSerializer.user_representation(self.user)
 
         return data
 
@@ -1,9 +1,12 @@
+import orjson
 from rest_framework import viewsets, permissions, status, generics
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -11,6 +14,8 @@ from drf_spectacular.utils import (
     OpenApiResponse,
 )
 from drf_spectacular.types import OpenApiTypes
+from issue_tracker.cache import etag_matches, make_etag
+from issue_tracker.schema import FORBIDDEN, INVALID_DATA, UNAUTHENTICATED
 
 from .serializers import (
     UserSerializer,
@@ -19,11 +24,31 @@ from .serializers import (
     UserUpdateSerializer,
     ChangePasswordSerializer,
 )
+from .authentication import user_detail_cache_key
+from .pagination import UserCursorPagination
 from .permissions import IsAdmin, IsMentorOrAdmin, IsOwnerOrMentorOrAdmin
 from .token import CustomTokenObtainPairView
 
 User = get_user_model()
 
+# Permission classes are stateless, so the viewset returns shared instances
+# instead of building new ones on every request
+_AUTHENTICATED = (permissions.IsAuthenticated(),)
+_ADMIN = (*_AUTHENTICATED, IsAdmin())
+_MENTOR_OR_ADMIN = (*_AUTHENTICATED, IsMentorOrAdmin())
+_OWNER_OR_MENTOR_OR_ADMIN = (*_AUTHENTICATED, IsOwnerOrMentorOrAdmin())
+
+# Schema response shared by the user actions
+USER_NOT_FOUND = OpenApiResponse(description="User not found.")
+
+# Columns UserSerializer and UserDetailSerializer render
+USER_LIST_COLUMNS = [
+    field for field in UserSerializer.Meta.fields if field != "role_display"
+]
+USER_DETAIL_COLUMNS = [
+    field for field in UserDetailSerializer.Meta.fields if field != "role_display"
+]
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -31,12 +56,8 @@ User = get_user_model()
         description="List all users. Only accessible to mentors and admins.",
         responses={
             200: UserSerializer(many=True),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
         },
     ),
     create=extend_schema(
@@ -44,13 +65,9 @@ User = get_user_model()
         description="Create a new user account. Only accessible to admins.",
         responses={
             201: UserDetailSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
         },
     ),
     retrieve=extend_schema(
@@ -58,13 +75,9 @@ User = get_user_model()
         description="Retrieve a specific user by ID. Users can retrieve their own details, mentors and admins can retrieve any user.",
         responses={
             200: UserDetailSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
-            404: OpenApiResponse(description="User not found."),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
+            404: USER_NOT_FOUND,
         },
     ),
     update=extend_schema(
@@ -72,14 +85,10 @@ User = get_user_model()
         description="Update a user's information. Users can update their own details, admins can update any user.",
         responses={
             200: UserDetailSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
-            404: OpenApiResponse(description="User not found."),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
+            404: USER_NOT_FOUND,
         },
     ),
     partial_update=extend_schema(
@@ -87,14 +96,10 @@ User = get_user_model()
         description="Partially update a user's information. Users can update their own details, admins can update any user.",
         responses={
             200: UserDetailSerializer,
-            400: OpenApiResponse(description="Bad request - invalid data."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
-            404: OpenApiResponse(description="User not found."),
+            400: INVALID_DATA,
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
+            404: USER_NOT_FOUND,
         },
     ),
     destroy=extend_schema(
@@ -102,13 +107,9 @@ User = get_user_model()
         description="Delete a user. Only accessible to admins.",
         responses={
             204: OpenApiResponse(description="User deleted successfully."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
-            403: OpenApiResponse(
-                description="You do not have permission to perform this action."
-            ),
-            404: OpenApiResponse(description="User not found."),
+            401: UNAUTHENTICATED,
+            403: FORBIDDEN,
+            404: USER_NOT_FOUND,
         },
     ),
 )
@@ -117,29 +118,45 @@ class UserViewSet(viewsets.ModelViewSet):
     ViewSet for managing users.
     """
 
-    queryset = User.objects.all().order_by("-date_joined")
+    queryset = User.objects.all().order_by("-date_joined", "-id")
+    pagination_class = UserCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Users have no relations to join; reads just skip the columns their
+        # serializer doesn't render (password hash, permission flags), while
+        # writes load whole rows to save them
+        if self.action == "list":
+            queryset = queryset.only(*USER_LIST_COLUMNS)
+        elif self.action == "retrieve":
+            queryset = queryset.only(*USER_DETAIL_COLUMNS)
+        return queryset
+
+    # Serializer per action, UserSerializer for the rest (list)
+    SERIALIZER_BY_ACTION = {
+        "create": UserCreateSerializer,
+        "update": UserUpdateSerializer,
+        "partial_update": UserUpdateSerializer,
+        "retrieve": UserDetailSerializer,
+        "me": UserDetailSerializer,
+    }
+
+    # Permissions per action, looked up like the serializer; the rest (me,
+    # change_password) only require authentication
+    PERMISSIONS_BY_ACTION = {
+        "create": _ADMIN,
+        "update": _OWNER_OR_MENTOR_OR_ADMIN,
+        "partial_update": _OWNER_OR_MENTOR_OR_ADMIN,
+        "destroy": _ADMIN,
+        "list": _MENTOR_OR_ADMIN,
+        "retrieve": _OWNER_OR_MENTOR_OR_ADMIN,
+    }
 
     def get_serializer_class(self):
-        if self.action == "create":
-            return UserCreateSerializer
-        elif self.action in ["update", "partial_update"]:
-            return UserUpdateSerializer
-        elif self.action == "retrieve" or self.detail:
-            return UserDetailSerializer
-        return UserSerializer
+        return self.SERIALIZER_BY_ACTION.get(self.action, UserSerializer)
 
     def get_permissions(self):
-        if self.action == "create":
-            return [permissions.IsAuthenticated(), IsAdmin()]
-        elif self.action in ["update", "partial_update"]:
-            return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
-        elif self.action == "destroy":
-            return [permissions.IsAuthenticated(), IsAdmin()]
-        elif self.action == "list":
-            return [permissions.IsAuthenticated(), IsMentorOrAdmin()]
-        elif self.action == "retrieve":
-            return [permissions.IsAuthenticated(), IsOwnerOrMentorOrAdmin()]
-        return [permissions.IsAuthenticated()]
+        return self.PERMISSIONS_BY_ACTION.get(self.action, _AUTHENTICATED)
 
     @extend_schema(
         summary="Change user password",
@@ -148,9 +165,7 @@ class UserViewSet(viewsets.ModelViewSet):
         responses={
             200: OpenApiResponse(description="Password changed successfully."),
             400: OpenApiResponse(description="Bad request - invalid password."),
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     )
     @action(
@@ -163,7 +178,7 @@ class UserViewSet(viewsets.ModelViewSet):
         if serializer.is_valid():
             user = request.user
             user.set_password(serializer.validated_data["new_password"])
-            user.save()
+            user.save(update_fields=["password"])
             return Response(
                 {"detail": "Password changed successfully."}, status=status.HTTP_200_OK
             )
@@ -174,17 +189,45 @@ class UserViewSet(viewsets.ModelViewSet):
         description="Get the authenticated user's details.",
         responses={
             200: UserDetailSerializer,
-            401: OpenApiResponse(
-                description="Authentication credentials were not provided."
-            ),
+            401: UNAUTHENTICATED,
         },
     )
     @action(
         detail=False, methods=["get"], permission_classes=[permissions.IsAuthenticated]
     )
     def me(self, request):
-        serializer = UserDetailSerializer(request.user)
-        return Response(serializer.data)
+        """
+        Return the current user with an ETag of the payload, so clients
+        polling with If-None-Match get a bodiless 304 while nothing changed.
+        The payload and ETag are cached for USER_DETAIL_CACHE_TIMEOUT seconds
+        under the user's version, which saving the user moves on.
+        """
+        user = request.user
+        timeout = settings.USER_DETAIL_CACHE_TIMEOUT
+        cached = None
+        if timeout:
+            # Versioned before the user is read, so a save committing in
+            # between leaves this payload under the expired version
+            cache_key = user_detail_cache_key(user.pk)
+            cached = cache.get(cache_key)
+        if cached is None:
+            # The cached authentication copy only holds the columns
+            # permission checks read
+            if user.get_deferred_fields():
+                user = User.objects.only(*USER_DETAIL_COLUMNS).get(pk=user.pk)
+            data = UserDetailSerializer.user_representation(user)
+            cached = (data, make_etag(orjson.dumps(data)))
+            if timeout:
+                cache.set(cache_key, cached, timeout)
+        data, etag = cached
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, max-age=5",
+            "Vary": "Authorization",
+        }
+        if etag_matches(request, headers["ETag"]):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, headers=headers)
 
 
 @extend_schema(
@@ -193,7 +236,7 @@ class UserViewSet(viewsets.ModelViewSet):
     request=UserCreateSerializer,
     responses={
         201: UserDetailSerializer,
-        400: OpenApiResponse(description="Bad request - invalid data."),
+        400: INVALID_DATA,
     },
     tags=["authentication"],
 )
@@ -216,7 +259,7 @@ class RegisterView(generics.CreateAPIView):
 
         return Response(
             {
-                "user": UserDetailSerializer(user).data,
+                "user": UserDetailSerializer.user_representation(user),
                 "tokens": {
                     "refresh": str(refresh),
                     "access": str(refresh.access_token),
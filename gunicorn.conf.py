@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for running issue_tracker in production.
+
+Usage: gunicorn -c gunicorn.conf.py issue_tracker.wsgi:application
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# The API is I/O bound (database round-trips), so each worker process serves
+# several requests concurrently on threads instead of one at a time.
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 5))
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+accesslog = "-"
+
+# Load Django in the master before forking so workers share the imported
+# code copy-on-write and serve their first request without the import cost
+preload_app = True
+
+
+def when_ready(server):
+    # Preloading only runs django.setup(); also import the URLconf so every
+    # view, serializer and filter module is loaded before the fork
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
@@ -0,0 +1,50 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.cache import parse_etags
+
+
+def current_version(key):
+    """
+    Return the version stored under a cache key, for building the keys of
+    the responses it covers.
+
+    A lost version key restarts from the clock, never from an old value, so
+    responses cached under an earlier version can't come back.
+    """
+    return cache.get_or_set(key, time.time_ns, None)
+
+
+def bump_version(key):
+    """Move a version on, expiring every response cached under the old one"""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_versions(keys):
+    """
+    Expire several versions in one round trip: dropping the keys makes the
+    next current_version() of each restart from the clock.
+    """
+    cache.delete_many(keys)
+
+
+def make_etag(content):
+    """Return a strong ETag for bytes: a short blake2b digest, quoted"""
+    return f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request, etag):
+    """
+    Whether the request's If-None-Match header covers the ETag, parsed as a
+    list of tags with "*" matching anything and the weak comparison that
+    If-None-Match calls for (W/"x" matches "x").
+    """
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if "*" in etags:
+        return True
+    etag = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == etag for tag in etags)
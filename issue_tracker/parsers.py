@@ -0,0 +1,22 @@
+import orjson
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    JSONParser that decodes request bodies with orjson.
+
+    orjson only reads UTF-8, the encoding JSON bodies are required to use,
+    and like STRICT_JSON rejects NaN and Infinity.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,35 @@
+import orjson
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+# Types orjson hands back to DRF's encoder, so they render exactly as
+# JSONRenderer renders them (e.g. datetimes in DRF's ISO 8601 format), and
+# non-string dict keys stringified as json does (DRF keys ListField child
+# errors by index)
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer that encodes compact responses with orjson.
+
+    Indented output (?format=json with an indent in the Accept header, the
+    browsable API) still goes through JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+
+        # Escape U+2028 and U+2029 as JSONRenderer does, so the output stays a
+        # strict javascript subset
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,10 @@
+from drf_spectacular.utils import OpenApiResponse
+
+# Schema responses shared by the apps' views, built once at import
+UNAUTHENTICATED = OpenApiResponse(
+    description="Authentication credentials were not provided."
+)
+FORBIDDEN = OpenApiResponse(
+    description="You do not have permission to perform this action."
+)
+INVALID_DATA = OpenApiResponse(description="Bad request - invalid data.")
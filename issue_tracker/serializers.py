@@ -0,0 +1,65 @@
+import copy
+
+from rest_framework import serializers
+from rest_framework.serializers import raise_errors_on_nested_writes
+from rest_framework.utils import model_meta
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects its model to build fields once per class.
+
+    Fields are bound to the serializer instance using them, so every instance
+    gets its own copies: plain fields are copied shallowly, nested serializers
+    deeply since they hold their own bound children.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {
+            name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for name, field in fields.items()
+        }
+
+
+class UpdateFieldsMixin:
+    """
+    ModelSerializer mixin whose update() writes only the submitted columns.
+
+    The UPDATE names just the validated fields plus any auto_now timestamps,
+    so untouched columns, and the triggers and indexes keyed on them, are
+    left alone. Many-to-many values are set after the save, as
+    ModelSerializer.update() does.
+    """
+
+    def update(self, instance, validated_data):
+        raise_errors_on_nested_writes("update", self, validated_data)
+        relations = model_meta.get_field_info(instance).relations
+
+        m2m_fields = []
+        update_fields = []
+        for attr, value in validated_data.items():
+            if attr in relations and relations[attr].to_many:
+                m2m_fields.append((attr, value))
+            else:
+                setattr(instance, attr, value)
+                update_fields.append(attr)
+        auto_now_fields = [
+            field.name
+            for field in instance._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        ]
+        instance.save(update_fields=[*update_fields, *auto_now_fields])
+
+        for attr, value in m2m_fields:
+            getattr(instance, attr).set(value)
+        return instance
@@ -45,6 +45,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Serves collected static files (admin, browsable API) before the rest of
+    # the stack runs
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -84,6 +87,10 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Keep connections open across requests instead of reconnecting on
+        # every one, checking them before reuse
+        "CONN_MAX_AGE": config("CONN_MAX_AGE", default=60, cast=int),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -106,6 +113,25 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Argon2id costs: 64 MiB and two passes over two lanes stays above OWASP's
+# minimums while costing less per login than Django's 100 MiB over eight
+ARGON2_TIME_COST = config("ARGON2_TIME_COST", default=2, cast=int)
+ARGON2_MEMORY_COST = config("ARGON2_MEMORY_COST", default=65536, cast=int)
+ARGON2_PARALLELISM = config("ARGON2_PARALLELISM", default=2, cast=int)
+
+# Argon2 hashes new passwords; hashes made with other Argon2 costs and the
+# PBKDF2 hashers' still verify (and are upgraded on the next login)
+PASSWORD_HASHERS = config(
+    "PASSWORD_HASHERS",
+    default=",".join(
+        [
+            "apps.users.hashers.TunedArgon2PasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+            "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+        ]
+    ),
+).split(",")
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -123,6 +149,14 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = "static/"
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# collectstatic also writes gzip/brotli copies, which WhiteNoise serves to
+# clients that accept them
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedStaticFilesStorage"},
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -139,9 +173,18 @@ CORS_ALLOWED_ORIGINS = [
 # Update the REST_FRAMEWORK configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "issue_tracker.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "issue_tracker.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -152,6 +195,75 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Render issue list endpoints from queryset.values() rows instead of model
+# instances and serializer fields (same response shape)
+ISSUE_LIST_VALUES_FAST_PATH = config(
+    "ISSUE_LIST_VALUES_FAST_PATH", default=True, cast=bool
+)
+
+# Render the notification list from queryset.values() rows the same way
+NOTIFICATION_LIST_VALUES_FAST_PATH = config(
+    "NOTIFICATION_LIST_VALUES_FAST_PATH", default=True, cast=bool
+)
+
+# Cache: Redis when REDIS_URL is set, otherwise per-process memory
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_URL,
+            "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        }
+    }
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# A write expires cached responses only in the cache it reaches, so caches
+# that rely on that default to on only when every worker shares Redis; in
+# per-process memory other workers would keep serving the old copy
+SHARED_CACHE = bool(REDIS_URL)
+
+# Seconds to cache issue list responses per user and query (0 disables)
+ISSUE_LIST_CACHE_TIMEOUT = config(
+    "ISSUE_LIST_CACHE_TIMEOUT", default=30 if SHARED_CACHE else 0, cast=int
+)
+
+# Seconds to cache knowledge base list and article responses (0 disables)
+KB_CACHE_TIMEOUT = config(
+    "KB_CACHE_TIMEOUT", default=300 if SHARED_CACHE else 0, cast=int
+)
+
+# Seconds to cache each user's notification list and unread count (0
+# disables); any change to their notifications expires them at once
+NOTIFICATION_CACHE_TIMEOUT = config(
+    "NOTIFICATION_CACHE_TIMEOUT", default=300 if SHARED_CACHE else 0, cast=int
+)
+
+# Days read notifications are kept before purge_notifications deletes them
+NOTIFICATION_RETENTION_DAYS = config(
+    "NOTIFICATION_RETENTION_DAYS", default=30, cast=int
+)
+
+# Seconds a validated access token is reused without decoding it again (0
+# disables)
+JWT_VALIDATION_CACHE_SECONDS = config(
+    "JWT_VALIDATION_CACHE_SECONDS", default=5, cast=int
+)
+
+# Seconds an authenticated user's id, role, cohort and active flag are
+# served from the cache instead of queried on each request (0 disables);
+# saving the user expires them at once
+USER_AUTH_CACHE_TIMEOUT = config(
+    "USER_AUTH_CACHE_TIMEOUT", default=30 if SHARED_CACHE else 0, cast=int
+)
+
+# Seconds to cache each user's /users/me/ payload (0 disables); saving the
+# user expires it at once
+USER_DETAIL_CACHE_TIMEOUT = config(
+    "USER_DETAIL_CACHE_TIMEOUT", default=300 if SHARED_CACHE else 0, cast=int
+)
+
 # JWT settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=7),
@@ -267,3 +379,10 @@ ALLOWED_MIME_TYPES = [
 
 # Maximum file upload size (5MB)
 MAX_UPLOAD_SIZE = 5 * 1024 * 1024
+
+# Internal nginx location that serves MEDIA_ROOT (e.g. "/protected/"). When
+# set, attachment downloads are handed to nginx with X-Accel-Redirect after
+# the permission check instead of being streamed through Django
+ATTACHMENT_ACCEL_REDIRECT_PREFIX = config(
+    "ATTACHMENT_ACCEL_REDIRECT_PREFIX", default=""
+)
@@ -2,11 +2,9 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+
+from .views import CachedSpectacularAPIView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -21,7 +19,7 @@ urlpatterns = [
                 path("", include("apps.notifications.urls")),
                 path("", include("apps.kb.urls")),
                 # API schema and documentation
-                path("schema/", SpectacularAPIView.as_view(), name="schema"),
+                path("schema/", CachedSpectacularAPIView.as_view(), name="schema"),
                 path(
                     "docs/",
                     SpectacularSwaggerView.as_view(url_name="schema"),
@@ -37,7 +35,8 @@ urlpatterns = [
     ),
 ]
 
-# Add static and media URLs in development
+# Add static and media URLs in development; in production WhiteNoise serves
+# static files and attachments go through nginx (ATTACHMENT_ACCEL_REDIRECT_PREFIX)
 if settings.DEBUG:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,48 @@
+from django.http import HttpResponse
+from django.utils import translation
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+
+# Most rendered schema variants (URL, media type, language) kept per process
+SCHEMA_CACHE_SIZE = 16
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    SpectacularAPIView that generates and renders each schema variant once
+    per process.
+
+    The schema only changes when the code does, so after the first request
+    for a format, version and language the stored bytes are served and
+    neither the introspection pass nor the YAML/JSON rendering runs again.
+    Swagger UI and Redoc load their schema from this view.
+    """
+
+    _responses = {}
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        # Runs after APIView.initial(), so cached schemas are still behind
+        # authentication, SERVE_PERMISSIONS and throttling. A non-public
+        # schema depends on the user and is never cached.
+        if not self.serve_public:
+            return super().get(request, *args, **kwargs)
+
+        key = (
+            request.get_full_path(),
+            request.accepted_media_type,
+            translation.get_language(),
+        )
+        cached = self._responses.get(key)
+        if cached is not None:
+            content, headers = cached
+            return HttpResponse(content, headers=headers)
+
+        response = self.finalize_response(
+            request, super().get(request, *args, **kwargs), *args, **kwargs
+        )
+        response.render()
+        # The key comes from the request, so bound how many are kept
+        if response.status_code == 200 and len(self._responses) < SCHEMA_CACHE_SIZE:
+            self._responses[key] = (response.content, dict(response.items()))
+        return response